@@ -1,8 +1,19 @@
 from student_society_event_planner.utils import parse_args, load_event_file
-from student_society_event_planner.algorithms import bruteforce, bottom_up
+from student_society_event_planner.algorithms import (
+    bruteforce,
+    bottom_up,
+    resumable_bruteforce,
+    resumable_bottom_up,
+)
+from student_society_event_planner.output import Report, WRITERS
 
+from pathlib import Path
+import sys
 import time
 
+# Where solver progress is saved with --checkpoint or --resume
+CHECKPOINT_DIR = Path("checkpoints")
+
 def main() -> None:
     """Program entrypoint."""
     # Parse command line arguments
@@ -15,45 +26,46 @@ def main() -> None:
         print(f"Error with loading event file {args.input_file}: {str(e)}")
         return
 
-    print(
-        "========================================\n"
-        "EVENT PLANNER - RESULTS\n"
-        "========================================\n\n"
-        f"Input File: {args.input_file}\n"
-        f"Available Time: {event.max_time} hours\n"
-        f"Available Budget: £{event.max_budget}\n"
-        "Constraint: Time"
-    )
-
-    start = time.perf_counter()
-    optimal_choices = bruteforce(event, 600)
-    end = time.perf_counter()
-
-    bruteforce_time = end - start
-
-    print(
-        "\n--- BRUTE FORCE ALGORITHM ---\n"
-        "Selected Activities:\n"
-        + '\n'.join([f"- {str(activity)}" for activity in optimal_choices[0]]) +
-        f"\n\nTotal Enjoyment: {optimal_choices[1]}\n"
-        f"Total Time Used: {optimal_choices[2]} hours\n\n"
-        f"Execution Time: {bruteforce_time:.5f} seconds"
-    )
-
-    start = time.perf_counter()
-    optimal_choices = bottom_up(event, 600)
-    end = time.perf_counter()
-
-    bottom_up_time = end - start
-
-    print(
-        "\n--- BOTTOM UP ALGORITHM ---\n"
-        "Selected Activities:\n"
-        + '\n'.join([f"- {str(activity)}" for activity in optimal_choices[0]]) +
-        f"\n\nTotal Enjoyment: {optimal_choices[1]}\n"
-        f"Total Time Used: {optimal_choices[2]} hours\n\n"
-        f"Execution Time: {bottom_up_time:.5f} seconds"
-    )
+    solvers = ((bruteforce, "BRUTE FORCE"), (bottom_up, "BOTTOM UP"))
+    if args.checkpoint or args.resume:
+        solvers = (
+            (resumable_bruteforce, "BRUTE FORCE"),
+            (resumable_bottom_up, "BOTTOM UP")
+        )
+
+    # Write all the output through a single buffered stream
+    with open(
+        sys.stdout.fileno(), "w", buffering=1 << 16, encoding="utf-8", closefd=False
+    ) as stream:
+        writer = WRITERS[args.format](stream, quiet=args.quiet)
+        writer.write_header(args.input_file, event)
+
+        for solver, title in solvers:
+            solver_name = solver.__name__.removeprefix("resumable_")
+
+            start = time.perf_counter()
+            if args.checkpoint or args.resume:
+                checkpoint_path = (
+                    CHECKPOINT_DIR / f"{Path(args.input_file).stem}.{solver_name}.ckpt"
+                )
+
+                # Without --resume, start from scratch
+                if not args.resume:
+                    checkpoint_path.unlink(missing_ok=True)
+
+                try:
+                    optimal_choices = solver(event, 600, checkpoint_path)
+                except ValueError as e:
+                    stream.flush()
+                    print(f"Error with resuming {checkpoint_path}: {str(e)}")
+                    return
+            else:
+                optimal_choices = solver(event, 600)
+            end = time.perf_counter()
+
+            writer.write_report(
+                Report(solver_name, title, *optimal_choices, end - start)
+            )
 
 if __name__ == "__main__":
     main()
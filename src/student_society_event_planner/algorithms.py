@@ -1,16 +1,63 @@
+from array import array
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+import mmap
+import tempfile
 import time
 import sys
 
+from .bounds import FractionalBound, density
+from .checkpoint import event_fingerprint, load_checkpoint, save_checkpoint
 from .classes import Activity, Event
 
 # Recursion limit increased to handle larger numbers of activities
 sys.setrecursionlimit(1000)
 
+# Largest shared DP cache multi_window builds before using fractional bounds
+MAX_BOUND_CACHE_CELLS = 2_000_000
+
+# Most DP states constrained_bottom_up keeps per item, past which it gives up
+MAX_CONSTRAINT_STATES = 1024
+
+# Default size of the decision bit blocks held in memory by out_of_core_bottom_up
+OUT_OF_CORE_BLOCK_BYTES = 64 * 1024 * 1024
+
+def _expand_repeats(activities: list[Activity]) -> list[Activity]:
+    """Return the activities with each one listed once per repeat."""
+    return [activity for activity in activities for _ in range(activity.repeats)]
+
+def _split_counts(repeats: int) -> list[int]:
+    """Return counts of 1, 2, 4, ... copies plus the remainder adding up to repeats.
+
+    Every number of copies from 0 to repeats is the sum of some of the counts,
+    so k copies cost O(log k) DP items instead of k.
+    """
+    counts = []
+    count = 1
+    while repeats > 0:
+        count = min(count, repeats)
+        counts.append(count)
+        repeats -= count
+        count *= 2
+    return counts
+
+def _binary_split(activities: list[Activity]) -> list[tuple[Activity, int]]:
+    """Return (activity, count) items that can make up any number of repeats."""
+    return [
+        (activity, count)
+        for activity in activities for count in _split_counts(activity.repeats)
+    ]
+
 def bruteforce(event: Event, time_limit: float) -> tuple[list[Activity], int, int]:
     """Return the optimal activity choices using a brute-force approach."""
-    activities_count = len(event.activities)
+    activities = _expand_repeats(event.activities)
+    activities_count = len(activities)
     start = time.perf_counter()
 
+    # Constraints are checked as each activity is taken and at every leaf
+    rules = _constraint_rules(event) if event.constraints else None
+
     # Recursive sub-function
     def recursive_bruteforce(
         i: int,
@@ -23,15 +70,19 @@ def bruteforce(event: Event, time_limit: float) -> tuple[list[Activity], int, in
 
         # Base case for when all activities are evaluated or the time limit is reached
         if elapsed_time >= time_limit or i == activities_count:
+            if i == activities_count and rules is not None and \
+                    not rules[1](chosen_activities):
+                return [], -1, 0
             return chosen_activities.copy(), enjoyment, time_used
 
         # Skip activity i
         best = recursive_bruteforce(i + 1, time_used, enjoyment, chosen_activities)
 
         # Check that taking activity i will not exceed the time limit
-        activity = event.activities[i]
+        activity = activities[i]
         new_time_used = time_used + activity.time
-        if new_time_used <= event.max_time:
+        if new_time_used <= event.max_time and \
+                (rules is None or rules[0](chosen_activities, activity)):
             # Take activity i
             chosen_activities.append(activity)
 
@@ -52,10 +103,20 @@ def bruteforce(event: Event, time_limit: float) -> tuple[list[Activity], int, in
         return best
 
     # Call the recursive sub-function
-    return recursive_bruteforce(0, 0, 0, [])
+    best = recursive_bruteforce(0, 0, 0, [])
+    if best[1] < 0:
+        raise ValueError("No choice of activities satisfies the constraints.")
+
+    return best
 
 def bottom_up(event: Event, time_limit: float) -> tuple[list[Activity], int, int]:
-    activities_count = len(event.activities)
+    # Events with constraints are solved over choice groups instead
+    if event.constraints:
+        return constrained_bottom_up(event, time_limit)
+
+    #Repeatable activities are split into items of 1, 2, 4, ... copies
+    items = _binary_split(event.activities)
+    activities_count = len(items)
     max_time = event.max_time
 
     #Create a DP table for the bottom-up approach
@@ -63,12 +124,14 @@ def bottom_up(event: Event, time_limit: float) -> tuple[list[Activity], int, int
 
     #Fill the DP table
     for i in range(1, activities_count + 1):
-        activity = event.activities[i - 1]
+        activity, count = items[i - 1]
+        item_time = activity.time * count
+        item_enjoyment = activity.enjoyment * count
         for j in range(max_time + 1):
             dp[i][j] = dp[i - 1][j]
 
-            if activity.time <= j:
-                enjoyment_count = dp[i - 1][j - activity.time] + activity.enjoyment
+            if item_time <= j:
+                enjoyment_count = dp[i - 1][j - item_time] + item_enjoyment
                 dp[i][j] = max(dp[i][j], enjoyment_count)
 
     max_enjoyment = 0
@@ -83,12 +146,1011 @@ def bottom_up(event: Event, time_limit: float) -> tuple[list[Activity], int, int
     i = activities_count
     t = time_used
 
-    while i > 0 and t > 0:
-        #if the value is different from the previous row, we don't take it
+    #zero-time activities can still be taken once t reaches 0
+    while i > 0:
+        #if the value is different from the previous row, we take it
         if dp[i][t] != dp[i - 1][t]:
-            choose = event.activities[i - 1]
-            chosen_activities.append(choose)
-            t -= choose.time
+            choose, count = items[i - 1]
+            chosen_activities.extend([choose] * count)
+            t -= choose.time * count
         i -= 1
 
-    return chosen_activities, dp[activities_count][time_used], time_used
\ No newline at end of file
+    return chosen_activities, dp[activities_count][time_used], time_used
+
+def _dp_row(items: list[tuple[Activity, int]], capacity: int) -> list[int]:
+    """Return the final rolling DP row for the given (activity, count) items."""
+    row = [0] * (capacity + 1)
+
+    for activity, count in items:
+        item_time = activity.time * count
+        item_enjoyment = activity.enjoyment * count
+
+        # Iterate downwards so each item is only taken once
+        for j in range(capacity, item_time - 1, -1):
+            enjoyment_count = row[j - item_time] + item_enjoyment
+            if enjoyment_count > row[j]:
+                row[j] = enjoyment_count
+
+    return row
+
+def hirschberg(event: Event, time_limit: float) -> tuple[list[Activity], int, int]:
+    """Return the optimal activity choices using linear-space divide and conquer."""
+    if event.constraints:
+        raise ValueError("Hirschberg does not support constraints.")
+
+    items = _binary_split(event.activities)
+
+    # Find the optimal enjoyment and the smallest time that achieves it
+    row = _dp_row(items, event.max_time)
+    max_enjoyment = row[event.max_time]
+    time_used = row.index(max_enjoyment)
+    del row
+
+    chosen_activities = []
+
+    # Recursive sub-function
+    def recursive_split(lo: int, hi: int, capacity: int) -> None:
+        # Base case for a single item
+        if hi - lo == 1:
+            activity, count = items[lo]
+            if activity.time * count <= capacity and activity.enjoyment > 0:
+                chosen_activities.extend([activity] * count)
+            return
+
+        # Solve both halves forwards and find the best way to split the capacity
+        mid = (lo + hi) // 2
+        left = _dp_row(items[lo:mid], capacity)
+        right = _dp_row(items[mid:hi], capacity)
+
+        split = 0
+        best = -1
+        for c in range(capacity + 1):
+            if left[c] + right[capacity - c] > best:
+                best = left[c] + right[capacity - c]
+                split = c
+
+        # Free the rows before recursing so only O(T) is held at a time
+        del left, right
+
+        recursive_split(lo, mid, split)
+        recursive_split(mid, hi, capacity - split)
+
+    if items:
+        recursive_split(0, len(items), time_used)
+
+    return chosen_activities, max_enjoyment, time_used
+
+def sparse_dp(event: Event, time_limit: float) -> tuple[list[Activity], int, int]:
+    """Return the optimal activity choices using only reachable, undominated states."""
+    if event.constraints:
+        raise ValueError("Sparse DP does not support constraints.")
+
+    max_time = event.max_time
+
+    # Parallel arrays sorted by time with strictly increasing enjoyment. Each
+    # state keeps a linked chain of (activity, count, previous chain) for
+    # backtracking.
+    times = [0]
+    enjoyments = [0]
+    chains: list[tuple | None] = [None]
+
+    for activity, copies in _binary_split(event.activities):
+        item_time = activity.time * copies
+        item_enjoyment = activity.enjoyment * copies
+        limit = max_time - item_time
+        if limit < 0 or item_enjoyment <= 0:
+            continue
+
+        new_times = []
+        new_enjoyments = []
+        new_chains = []
+
+        # Merge the existing states with the states shifted by this activity
+        i = 0
+        k = 0
+        count = len(times)
+        while i < count or k < count:
+            if k < count and times[k] <= limit:
+                shifted_time = times[k] + item_time
+            else:
+                shifted_time = None
+
+            if i < count and (shifted_time is None or times[i] <= shifted_time):
+                time_value = times[i]
+                enjoyment_value = enjoyments[i]
+                chain = chains[i]
+                i += 1
+            elif shifted_time is not None:
+                time_value = shifted_time
+                enjoyment_value = enjoyments[k] + item_enjoyment
+                chain = (activity, copies, chains[k])
+                k += 1
+            else:
+                break
+
+            # Prune states that are dominated by a faster state
+            if new_enjoyments and enjoyment_value <= new_enjoyments[-1]:
+                continue
+            if new_times and time_value == new_times[-1]:
+                new_enjoyments[-1] = enjoyment_value
+                new_chains[-1] = chain
+                continue
+
+            new_times.append(time_value)
+            new_enjoyments.append(enjoyment_value)
+            new_chains.append(chain)
+
+        times = new_times
+        enjoyments = new_enjoyments
+        chains = new_chains
+
+    # The last state has the most enjoyment and the least time for it
+    chosen_activities = []
+    chain = chains[-1]
+    while chain is not None:
+        chosen_activities.extend([chain[0]] * chain[1])
+        chain = chain[2]
+
+    return chosen_activities, enjoyments[-1], times[-1]
+
+def greedy(event: Event, time_limit: float) -> tuple[list[Activity], int, int, float]:
+    """Return a 1/2-approximate activity choice using a density-sorted greedy.
+
+    The fourth value is the guaranteed fraction of the optimal enjoyment.
+    """
+    if event.constraints:
+        raise ValueError("Greedy does not support constraints.")
+
+    max_time = event.max_time
+
+    # Repeats are split into items so the guarantee covers every copy
+    fitting = [
+        (activity, count) for activity, count in _binary_split(event.activities)
+        if activity.time * count <= max_time and activity.enjoyment > 0
+    ]
+
+    # Sort by enjoyment per hour, zero-time activities first
+    fitting.sort(key=lambda item: density(item[0]), reverse=True)
+
+    chosen_activities = []
+    enjoyment = 0
+    time_used = 0
+    for activity, count in fitting:
+        if time_used + activity.time * count <= max_time:
+            chosen_activities.extend([activity] * count)
+            enjoyment += activity.enjoyment * count
+            time_used += activity.time * count
+
+    # The best single item fixes the greedy's worst case
+    if fitting:
+        activity, count = max(fitting, key=lambda item: item[0].enjoyment * item[1])
+        if activity.enjoyment * count > enjoyment:
+            return [activity] * count, activity.enjoyment * count, \
+                activity.time * count, 0.5
+
+    return chosen_activities, enjoyment, time_used, 0.5
+
+def fptas(
+    event: Event,
+    time_limit: float,
+    epsilon: float = 0.1
+) -> tuple[list[Activity], int, int, float]:
+    """Return a (1 - epsilon)-approximate activity choice using scaled enjoyment.
+
+    Runs in O(n^2 / epsilon) time, independent of max_time. The fourth value is
+    the guaranteed fraction of the optimal enjoyment.
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError("Epsilon must be between 0 and 1.")
+    if event.constraints:
+        raise ValueError("FPTAS does not support constraints.")
+
+    max_time = event.max_time
+
+    # Repeats are split into items so the guarantee covers every copy
+    fitting = [
+        (activity, count) for activity, count in _binary_split(event.activities)
+        if activity.time * count <= max_time and activity.enjoyment > 0
+    ]
+
+    if not fitting:
+        return [], 0, 0, 1.0
+
+    # The greedy result is at least half the optimum, so scaling by it loses at
+    # most epsilon * optimum and caps the scaled optimum at 2n / epsilon
+    lower_bound = greedy(event, time_limit)[1]
+    scale = epsilon * lower_bound / len(fitting)
+    scaled = [int(a.enjoyment * count // scale) for a, count in fitting]
+    total = min(sum(scaled), int(2 * lower_bound / scale))
+
+    # min_time[p] is the least time that reaches a scaled enjoyment of exactly p
+    unreachable = max_time + 1
+    min_time = [0] + [unreachable] * total
+    chains: list[tuple | None] = [None] * (total + 1)
+
+    reached = 0
+    for (activity, count), profit in zip(fitting, scaled):
+        if profit > total:
+            continue
+        item_time = activity.time * count
+        for p in range(min(reached, total - profit), -1, -1):
+            new_time = min_time[p] + item_time
+            if new_time < min_time[p + profit]:
+                min_time[p + profit] = new_time
+                chains[p + profit] = (activity, count, chains[p])
+        reached += profit
+
+    best_profit = max(p for p in range(total + 1) if min_time[p] <= max_time)
+
+    chosen_activities = []
+    chain = chains[best_profit]
+    while chain is not None:
+        chosen_activities.extend([chain[0]] * chain[1])
+        chain = chain[2]
+
+    enjoyment = sum(a.enjoyment for a in chosen_activities)
+    time_used = sum(a.time for a in chosen_activities)
+
+    return chosen_activities, enjoyment, time_used, 1 - epsilon
+
+def multi_window(
+    event: Event,
+    time_limit: float
+) -> tuple[list[list[Activity]], int, int, bool]:
+    """Return the optimal activity choices for each of the event's time windows.
+
+    Each copy of an activity is assigned to at most one window. The search stops
+    at the time limit and returns the best assignment found so far, with a fourth
+    value that is True only if the search finished and the plan is optimal.
+    """
+    if event.constraints:
+        raise ValueError("Multi-window planning does not support constraints.")
+
+    start = time.perf_counter()
+    capacities = [max_time for max_time, _ in event.windows]
+    window_count = len(capacities)
+    total_capacity = sum(capacities)
+
+    # Only activities that can add enjoyment somewhere are searched, densest first.
+    # Copies of a repeated activity stay next to each other after the stable sort.
+    items = [
+        activity for activity in _expand_repeats(event.activities)
+        if activity.enjoyment > 0 and activity.time <= max(capacities, default=-1)
+    ]
+    items.sort(key=density, reverse=True)
+    items_count = len(items)
+
+    # Shared DP cache: suffix[i][c] is the best enjoyment of items[i:] with all the
+    # windows merged into a single capacity c, an upper bound for any assignment.
+    # Past the size limit, the fractional bound over the same order is used instead.
+    if items_count * (total_capacity + 1) <= MAX_BOUND_CACHE_CELLS:
+        suffix = [[0] * (total_capacity + 1)]
+        for activity in reversed(items):
+            row = suffix[-1].copy()
+            for j in range(total_capacity, activity.time - 1, -1):
+                enjoyment_count = row[j - activity.time] + activity.enjoyment
+                if enjoyment_count > row[j]:
+                    row[j] = enjoyment_count
+            suffix.append(row)
+        suffix.reverse()
+
+        def upper_bound(i: int, capacity: int) -> int:
+            return suffix[i][capacity]
+    else:
+        fractional = FractionalBound(items)
+
+        def upper_bound(i: int, capacity: int) -> int:
+            return fractional.upper_bound(capacity, i)
+
+    # Initial incumbent from solving the windows one after another
+    best_assignment = [-1] * items_count
+    best = 0
+    remaining = list(range(items_count))
+    for k, (max_time, max_budget) in enumerate(event.windows):
+        # Single copy stand-ins, so each copy is assigned on its own
+        copies = {
+            i: Activity(items[i].name, items[i].time, items[i].cost, items[i].enjoyment)
+            for i in remaining
+        }
+        window_event = Event(max_time, max_budget, list(copies.values()))
+        chosen, enjoyment, _ = bottom_up(window_event, time_limit)
+        chosen_ids = {id(activity) for activity in chosen}
+        for i in remaining:
+            if id(copies[i]) in chosen_ids:
+                best_assignment[i] = k
+        remaining = [i for i in remaining if best_assignment[i] == -1]
+        best += enjoyment
+
+    # Bound-driven depth first search, trying each window before skipping an item
+    proven = True
+    if best < upper_bound(0, total_capacity):
+        residual = capacities.copy()
+        residual_total = total_capacity
+        assignment = [-1] * items_count
+        options = [0] * (items_count + 1)
+        enjoyment = 0
+        nodes = 0
+        i = 0
+
+        while i >= 0:
+            activity = items[i] if i < items_count else None
+
+            if options[i] == 0:
+                # Check the time limit every so often
+                nodes += 1
+                if nodes % 4096 == 0 and time.perf_counter() - start >= time_limit:
+                    proven = False
+                    break
+
+                if enjoyment > best:
+                    best = enjoyment
+                    best_assignment = assignment.copy()
+
+                # Prune if even the merged-capacity bound cannot beat the incumbent
+                if i == items_count or \
+                        enjoyment + upper_bound(i, residual_total) <= best:
+                    i -= 1
+                    continue
+            else:
+                # Undo the previous choice at this depth
+                k = assignment[i]
+                if k >= 0:
+                    residual[k] += activity.time
+                    residual_total += activity.time
+                    enjoyment -= activity.enjoyment
+                    assignment[i] = -1
+
+            # Find the next window with room, skipping windows with the same
+            # residual capacity as an earlier one since they are symmetric.
+            # Copies of one activity take windows in order, with skips last.
+            k = options[i]
+            if i > 0 and activity is items[i - 1]:
+                previous = assignment[i - 1]
+                k = max(k, previous if previous >= 0 else window_count)
+            while k < window_count and (
+                residual[k] < activity.time or residual[k] in residual[:k]
+            ):
+                k += 1
+
+            if k < window_count:
+                residual[k] -= activity.time
+                residual_total -= activity.time
+                enjoyment += activity.enjoyment
+                assignment[i] = k
+                options[i] = k + 1
+            elif k == window_count:
+                # Skip the activity
+                options[i] = window_count + 1
+            else:
+                # All options tried, backtrack
+                options[i] = 0
+                i -= 1
+                continue
+
+            i += 1
+            options[i] = 0
+
+    chosen_activities = [[] for _ in range(window_count)]
+    for activity, k in zip(items, best_assignment):
+        if k >= 0:
+            chosen_activities[k].append(activity)
+
+    time_used = sum(a.time for window in chosen_activities for a in window)
+
+    return chosen_activities, best, time_used, proven
+
+def _constraint_names(event: Event) -> dict[str, list[Activity]]:
+    """Return the event's activities by name, checking the constraints refer to them."""
+    constraints = event.constraints
+    by_name: dict[str, list[Activity]] = {}
+    for activity in event.activities:
+        by_name.setdefault(activity.name, []).append(activity)
+
+    # Check every rule refers to a known activity
+    names = set(constraints.mandatory) | set(constraints.excluded)
+    for pair in constraints.conflicts:
+        names.update(pair)
+    for group_names, _ in constraints.groups:
+        names.update(group_names)
+    unknown = names - by_name.keys()
+    if unknown:
+        raise ValueError(f"Unknown activities in constraints: {sorted(unknown)}")
+
+    if constraints.mandatory & constraints.excluded:
+        raise ValueError("Activities are both mandatory and excluded.")
+
+    return by_name
+
+def _constraint_rules(
+    event: Event
+) -> tuple[
+    Callable[[list[Activity], Activity], bool],
+    Callable[[list[Activity]], bool]
+]:
+    """Return checks for adding an activity to a partial choice and for a full choice.
+
+    Used by the search based solvers, which try every choice anyway.
+    """
+    constraints = event.constraints
+    by_name = _constraint_names(event)
+
+    conflicts_of: dict[str, set[str]] = {}
+    for first, second in constraints.conflicts:
+        conflicts_of.setdefault(first, set()).add(second)
+        conflicts_of.setdefault(second, set()).add(first)
+
+    forced_ids = {id(a) for name in constraints.mandatory for a in by_name[name]}
+
+    def can_take(chosen: list[Activity], activity: Activity) -> bool:
+        if activity.name in constraints.excluded:
+            return False
+        conflicting = conflicts_of.get(activity.name)
+        if conflicting and any(a.name in conflicting for a in chosen):
+            return False
+        return all(
+            sum(a.name in group_names for a in chosen) < limit
+            for group_names, limit in constraints.groups
+            if activity.name in group_names
+        )
+
+    def is_complete(chosen: list[Activity]) -> bool:
+        return forced_ids <= {id(a) for a in chosen}
+
+    return can_take, is_complete
+
+def _constrained_items(
+    event: Event
+) -> tuple[
+    list[Activity],
+    int,
+    list[tuple[Activity, int]],
+    list[tuple[set[str], int]],
+    dict[str, set[str]]
+]:
+    """Return what is left to choose once an event's constraints are applied.
+
+    The values are the forced activities, the time left, the optional
+    (activity, count) items in solving order, the group limits that can still
+    bind and the conflicts between optional activities. One copy of each
+    mandatory activity is forced, and any other repeats stay optional.
+    """
+    constraints = event.constraints
+    by_name = _constraint_names(event)
+
+    # Forced activities are pre-deducted from the available time
+    forced = [a for name in constraints.mandatory for a in by_name[name]]
+    capacity = event.max_time - sum(a.time for a in forced)
+    if capacity < 0:
+        raise ValueError("Mandatory activities exceed the available time.")
+
+    # Conflicts with forced activities exclude the other activity
+    excluded = set(constraints.excluded)
+    conflicts = []
+    for first, second in constraints.conflicts:
+        if first in constraints.mandatory and second in constraints.mandatory:
+            raise ValueError("Mandatory activities conflict.")
+        if first in constraints.mandatory:
+            excluded.add(second)
+        elif second in constraints.mandatory:
+            excluded.add(first)
+        else:
+            conflicts.append((first, second))
+
+    items = []
+    for activity in event.activities:
+        if activity.name in excluded or activity.enjoyment <= 0:
+            continue
+        repeats = activity.repeats
+        if activity.name in constraints.mandatory:
+            repeats -= 1
+        items.extend(
+            (activity, count) for count in _split_counts(repeats)
+            if activity.time * count <= capacity
+        )
+    item_names = {activity.name for activity, _ in items}
+
+    # Group limits are reduced by forced members, and ignored if they can't bind
+    limits = []
+    for group_names, limit in constraints.groups:
+        limit -= sum(len(by_name[name]) for name in group_names & constraints.mandatory)
+        if limit < 0:
+            raise ValueError("Mandatory activities exceed a group limit.")
+
+        # The most copies that fit in the time left, taking the shortest first
+        copies = 0
+        time_left = capacity
+        members = sorted(
+            (item for item in items if item[0].name in group_names),
+            key=lambda item: item[0].time
+        )
+        for activity, count in members:
+            if activity.time > 0:
+                count = min(count, time_left // activity.time)
+            copies += count
+            time_left -= activity.time * count
+
+        if copies > limit:
+            limits.append((group_names & item_names, limit))
+
+    neighbours: dict[str, set[str]] = {}
+    for first, second in conflicts:
+        if first in item_names and second in item_names:
+            neighbours.setdefault(first, set()).add(second)
+            neighbours.setdefault(second, set()).add(first)
+
+    groups_of: dict[str, list[int]] = {}
+    for k, (group_names, _) in enumerate(limits):
+        for name in group_names:
+            groups_of.setdefault(name, []).append(k)
+
+    # Unlinked activities go first, then linked ones in breadth first order so
+    # few activities are left undecided while their links are solved
+    first_item = {}
+    for i, (activity, _) in enumerate(items):
+        first_item.setdefault(activity.name, i)
+    names = sorted(item_names, key=first_item.get)
+
+    ordered = [
+        name for name in names if name not in neighbours and name not in groups_of
+    ]
+    seen = set(ordered)
+    expanded_groups = set()
+    for root in names:
+        if root in seen:
+            continue
+        seen.add(root)
+        queue = deque([root])
+        while queue:
+            name = queue.popleft()
+            ordered.append(name)
+
+            linked = list(neighbours.get(name, ()))
+            for k in groups_of.get(name, ()):
+                if k not in expanded_groups:
+                    expanded_groups.add(k)
+                    linked.extend(limits[k][0])
+            for other in sorted(linked, key=first_item.get):
+                if other not in seen:
+                    seen.add(other)
+                    queue.append(other)
+
+    position = {name: i for i, name in enumerate(ordered)}
+    items.sort(key=lambda item: position[item[0].name])
+
+    return forced, capacity, items, limits, neighbours
+
+def constrained_bottom_up(
+    event: Event,
+    time_limit: float
+) -> tuple[list[Activity], int, int]:
+    """Return the optimal activity choices that satisfy the event's constraints.
+
+    The DP state adds the undecided conflicting activities taken so far and the
+    counts of the open group limits, so each item costs O(T) per state.
+    """
+    forced, capacity, items, limits, neighbours = _constrained_items(event)
+
+    groups_of: dict[str, list[int]] = {}
+    for k, (group_names, _) in enumerate(limits):
+        for name in group_names:
+            groups_of.setdefault(name, []).append(k)
+
+    # A taken name is kept in the state until it and its conflicts are decided,
+    # and a group count until all of the group's members are
+    last_item = {activity.name: i for i, (activity, _) in enumerate(items)}
+    closing_names: list[set[str]] = [set() for _ in items]
+    for name, others in neighbours.items():
+        closing_names[max(last_item[o] for o in others | {name})].add(name)
+    closing_groups: list[list[int]] = [[] for _ in items]
+    for k, (group_names, _) in enumerate(limits):
+        closing_groups[max(last_item[name] for name in group_names)].append(k)
+
+    def successors(
+        i: int,
+        key: tuple[frozenset[str], tuple[int, ...]]
+    ) -> tuple[tuple, tuple | None]:
+        """Return the states after skipping and after taking item i."""
+        taken, counts = key
+        activity, count = items[i]
+        name = activity.name
+
+        def close(taken: frozenset[str], counts: tuple[int, ...]) -> tuple:
+            if closing_names[i]:
+                taken = taken - closing_names[i]
+            if closing_groups[i]:
+                counts = tuple(
+                    0 if k in closing_groups[i] else c for k, c in enumerate(counts)
+                )
+            return taken, counts
+
+        skip = close(taken, counts)
+
+        if name in neighbours and neighbours[name] & taken:
+            return skip, None
+        new_counts = list(counts)
+        for k in groups_of.get(name, ()):
+            new_counts[k] += count
+            if new_counts[k] > limits[k][1]:
+                return skip, None
+        if name in neighbours:
+            taken = taken | {name}
+
+        return skip, close(taken, tuple(new_counts))
+
+    # rows[state][j] is the best enjoyment within j hours, unreachable cells are -inf
+    unreachable = float("-inf")
+    start_key = (frozenset(), (0,) * len(limits))
+    rows = {start_key: [0] * (capacity + 1)}
+    history = []
+
+    for i, (activity, count) in enumerate(items):
+        history.append(rows)
+        item_time = activity.time * count
+        item_enjoyment = activity.enjoyment * count
+
+        next_rows = {}
+        for key, row in rows.items():
+            skip, take = successors(i, key)
+            candidates = [(skip, row)]
+            if take is not None:
+                shifted = [unreachable] * item_time + [
+                    value + item_enjoyment for value in row[:capacity + 1 - item_time]
+                ]
+                candidates.append((take, shifted))
+
+            # Rows are never changed in place, so unchanged rows can be shared
+            for next_key, next_row in candidates:
+                existing = next_rows.get(next_key)
+                if existing is not None:
+                    next_row = list(map(max, existing, next_row))
+                next_rows[next_key] = next_row
+
+        if len(next_rows) > MAX_CONSTRAINT_STATES:
+            raise ValueError("Constraints link too many activities to solve.")
+        rows = next_rows
+
+    # Every state is closed after the last item
+    final_row = rows[start_key]
+    max_enjoyment = final_row[capacity]
+    time_used = final_row.index(max_enjoyment)
+
+    # Backtrack through the states, preferring to skip items
+    chosen_activities = list(forced)
+    key = start_key
+    t = time_used
+    value = max_enjoyment
+    for i in range(len(items) - 1, -1, -1):
+        activity, count = items[i]
+        item_time = activity.time * count
+        item_enjoyment = activity.enjoyment * count
+
+        found = None
+        for previous, row in history[i].items():
+            skip, take = successors(i, previous)
+            if skip == key and row[t] == value:
+                found = previous, False
+                break
+            if take == key and t >= item_time and \
+                    row[t - item_time] + item_enjoyment == value:
+                found = previous, True
+
+        key, taken = found
+        if taken:
+            chosen_activities.extend([activity] * count)
+            t -= item_time
+            value -= item_enjoyment
+
+    forced_enjoyment = sum(a.enjoyment for a in forced)
+    forced_time = sum(a.time for a in forced)
+
+    return chosen_activities, max_enjoyment + forced_enjoyment, time_used + forced_time
+
+def _load_state(
+    checkpoint_path: Path | None,
+    fingerprint: bytes,
+    kinds: dict[str, type]
+) -> dict[str, int | list[int] | bytes] | None:
+    """Return the saved solver state to resume from, if there is one.
+
+    Every field named in kinds must be present with the given type.
+    """
+    if checkpoint_path is None or not checkpoint_path.is_file():
+        return None
+
+    state = load_checkpoint(checkpoint_path)
+    if state.get("fingerprint") != fingerprint:
+        raise ValueError("Checkpoint does not match the event.")
+
+    for name, kind in kinds.items():
+        if not isinstance(state.get(name), kind):
+            raise ValueError("Invalid checkpoint file.")
+
+    return state
+
+def resumable_bruteforce(
+    event: Event,
+    time_limit: float,
+    checkpoint_path: Path | None = None,
+    interval: float = 10.0
+) -> tuple[list[Activity], int, int]:
+    """Return the brute-force activity choices, saving and resuming progress.
+
+    The search order and tie-break match bruteforce. The DFS path and the best
+    choices so far are saved every interval seconds and when the time limit is
+    reached, so a later call with the same checkpoint carries on from there.
+    """
+    activities = _expand_repeats(event.activities)
+    activities_count = len(activities)
+    max_time = event.max_time
+    fingerprint = event_fingerprint(event, "bruteforce")
+    start = time.perf_counter()
+    last_save = start
+
+    # Constraints are checked as each activity is taken and at every leaf
+    rules = _constraint_rules(event) if event.constraints else None
+
+    # branch[level] is 0 while exploring the skip branch and 1 for the take branch
+    branch = bytearray()
+    best_enjoyment = -1
+    best_time = 0
+    best_chosen: list[int] = []
+
+    state = _load_state(checkpoint_path, fingerprint, {
+        "branch": bytes,
+        "best_enjoyment": int,
+        "best_time": int,
+        "best_chosen": list,
+    })
+    if state is not None:
+        branch = bytearray(state["branch"])
+        best_enjoyment = state["best_enjoyment"]
+        best_time = state["best_time"]
+        best_chosen = state["best_chosen"]
+
+        if len(branch) > activities_count or set(branch) - {0, 1} or \
+                not all(0 <= k < activities_count for k in best_chosen):
+            raise ValueError("Invalid checkpoint file.")
+
+    # Running totals for the current path
+    time_used = sum(activities[k].time for k, b in enumerate(branch) if b)
+    enjoyment = sum(activities[k].enjoyment for k, b in enumerate(branch) if b)
+
+    def save() -> None:
+        save_checkpoint(checkpoint_path, {
+            "fingerprint": fingerprint,
+            "branch": bytes(branch),
+            "best_enjoyment": best_enjoyment,
+            "best_time": best_time,
+            "best_chosen": best_chosen,
+        })
+
+    finished = False
+    steps = 0
+    while True:
+        # Check the time limit and save progress every so often
+        steps += 1
+        if steps % 4096 == 0:
+            current_time = time.perf_counter()
+            if current_time - start >= time_limit:
+                break
+            if checkpoint_path is not None and current_time - last_save >= interval:
+                save()
+                last_save = current_time
+
+        # Descend the skip branches down to a leaf
+        if len(branch) < activities_count:
+            branch.append(0)
+            continue
+
+        # Keep the first leaf with strictly more enjoyment, as bruteforce does
+        if enjoyment > best_enjoyment and (
+            rules is None
+            or rules[1]([activities[k] for k, b in enumerate(branch) if b])
+        ):
+            best_enjoyment = enjoyment
+            best_time = time_used
+            best_chosen = [k for k, b in enumerate(branch) if b]
+
+        # Backtrack to the deepest skip branch whose take branch fits
+        while branch:
+            level = len(branch) - 1
+            activity = activities[level]
+            if branch[level] == 0:
+                if time_used + activity.time <= max_time and (
+                    rules is None or rules[0](
+                        [activities[k] for k, b in enumerate(branch[:level]) if b],
+                        activity
+                    )
+                ):
+                    branch[level] = 1
+                    time_used += activity.time
+                    enjoyment += activity.enjoyment
+                    break
+            else:
+                time_used -= activity.time
+                enjoyment -= activity.enjoyment
+            branch.pop()
+        else:
+            finished = True
+            break
+
+    # A finished search has nothing left to resume
+    if checkpoint_path is not None:
+        if finished:
+            checkpoint_path.unlink(missing_ok=True)
+        else:
+            save()
+
+    if finished and best_enjoyment < 0:
+        raise ValueError("No choice of activities satisfies the constraints.")
+
+    return [activities[k] for k in best_chosen], max(best_enjoyment, 0), best_time
+
+def resumable_bottom_up(
+    event: Event,
+    time_limit: float,
+    checkpoint_path: Path | None = None,
+    interval: float = 10.0
+) -> tuple[list[Activity], int, int]:
+    """Return the bottom-up activity choices, saving and resuming progress.
+
+    Only the rolling DP row and one decision bit per cell are kept, and both
+    are saved with the current row index every interval seconds. If the time
+    limit is reached, the best choices from the rows done so far are returned.
+    """
+    if event.constraints:
+        raise ValueError("Resumable bottom-up does not support constraints.")
+
+    items = _binary_split(event.activities)
+    activities_count = len(items)
+    max_time = event.max_time
+    row_bytes = max_time // 8 + 1
+    fingerprint = event_fingerprint(event, "bottom_up")
+    start = time.perf_counter()
+    last_save = start
+
+    row = [0] * (max_time + 1)
+    decisions = bytearray()
+    i = 0
+
+    state = _load_state(checkpoint_path, fingerprint, {
+        "row_index": int,
+        "row": list,
+        "decisions": bytes,
+    })
+    if state is not None:
+        i = state["row_index"]
+        row = state["row"]
+        decisions = bytearray(state["decisions"])
+
+        if not 0 <= i <= activities_count or len(row) != max_time + 1 or \
+                len(decisions) != i * row_bytes:
+            raise ValueError("Invalid checkpoint file.")
+
+    def save() -> None:
+        save_checkpoint(checkpoint_path, {
+            "fingerprint": fingerprint,
+            "row_index": i,
+            "row": row,
+            "decisions": bytes(decisions),
+        })
+
+    while i < activities_count:
+        # Fill the next row in place, marking the cells where the item is taken
+        activity, count = items[i]
+        item_time = activity.time * count
+        item_enjoyment = activity.enjoyment * count
+        taken = bytearray(row_bytes)
+        for j in range(max_time, item_time - 1, -1):
+            enjoyment_count = row[j - item_time] + item_enjoyment
+            if enjoyment_count > row[j]:
+                row[j] = enjoyment_count
+                taken[j >> 3] |= 1 << (j & 7)
+        decisions += taken
+        i += 1
+
+        # Check the time limit and save progress after each row
+        current_time = time.perf_counter()
+        if current_time - start >= time_limit:
+            break
+        if checkpoint_path is not None and current_time - last_save >= interval:
+            save()
+            last_save = current_time
+
+    if checkpoint_path is not None:
+        if i == activities_count:
+            checkpoint_path.unlink(missing_ok=True)
+        else:
+            save()
+
+    max_enjoyment = max(row)
+    time_used = row.index(max_enjoyment)
+
+    # Backtrack through the decision bits from the last row done
+    chosen_activities = []
+    t = time_used
+    for k in range(i - 1, -1, -1):
+        if decisions[k * row_bytes + (t >> 3)] >> (t & 7) & 1:
+            activity, count = items[k]
+            chosen_activities.extend([activity] * count)
+            t -= activity.time * count
+
+    return chosen_activities, max_enjoyment, time_used
+
+def out_of_core_bottom_up(
+    event: Event,
+    time_limit: float,
+    decisions_path: Path | None = None,
+    block_bytes: int = OUT_OF_CORE_BLOCK_BYTES
+) -> tuple[list[Activity], int, int]:
+    """Return the bottom-up activity choices with the decision bits kept on disk.
+
+    Only the value row and one block of decision bits are held in memory, so
+    peak memory is O(T + block_bytes) whatever the number of activities. The
+    decisions are written to decisions_path, or a temporary file if not given.
+    """
+    if event.constraints:
+        raise ValueError("Out-of-core bottom-up does not support constraints.")
+
+    items = _binary_split(event.activities)
+    activities_count = len(items)
+    max_time = event.max_time
+    row_bytes = max_time // 8 + 1
+    block_rows = max(1, min(activities_count, block_bytes // row_bytes))
+
+    if decisions_path is None:
+        decisions_file = tempfile.TemporaryFile()
+    else:
+        decisions_file = open(decisions_path, "w+b")
+
+    with decisions_file:
+        # Fill the value row in place, writing the decision bits a block at a time
+        row = array("q", bytes(8 * (max_time + 1)))
+        block = bytearray(block_rows * row_bytes)
+        rows_in_block = 0
+
+        for activity, count in items:
+            item_time = activity.time * count
+            item_enjoyment = activity.enjoyment * count
+            offset = rows_in_block * row_bytes
+            for j in range(max_time, item_time - 1, -1):
+                enjoyment_count = row[j - item_time] + item_enjoyment
+                if enjoyment_count > row[j]:
+                    row[j] = enjoyment_count
+                    block[offset + (j >> 3)] |= 1 << (j & 7)
+
+            rows_in_block += 1
+            if rows_in_block == block_rows:
+                decisions_file.write(block)
+                block[:] = bytes(len(block))
+                rows_in_block = 0
+
+        decisions_file.write(block[:rows_in_block * row_bytes])
+        decisions_file.flush()
+        del block
+
+        max_enjoyment = row[max_time]
+        time_used = row.index(max_enjoyment)
+        del row
+
+        # Backtrack by paging the decision blocks back in from the end
+        chosen_activities = []
+        t = time_used
+        if activities_count > 0:
+            with mmap.mmap(
+                decisions_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as decisions:
+                for block_start in range(
+                    (activities_count - 1) // block_rows * block_rows, -1, -block_rows
+                ):
+                    block_end = min(block_start + block_rows, activities_count)
+                    block = decisions[block_start * row_bytes:block_end * row_bytes]
+
+                    for k in range(block_end - 1, block_start - 1, -1):
+                        offset = (k - block_start) * row_bytes
+                        if block[offset + (t >> 3)] >> (t & 7) & 1:
+                            activity, count = items[k]
+                            chosen_activities.extend([activity] * count)
+                            t -= activity.time * count
+
+    return chosen_activities, max_enjoyment, time_used
@@ -0,0 +1,76 @@
+from bisect import bisect_right
+
+from .classes import Activity, Event
+
+def density(activity: Activity) -> float:
+    """Return the enjoyment per hour of an activity, zero-time activities first."""
+    if activity.time == 0:
+        return float("inf")
+    return activity.enjoyment / activity.time
+
+class FractionalBound:
+    """Fractional knapsack upper bounds over activities sorted by density.
+
+    Each activity can be taken counts[k] times, once each if counts is not given.
+    """
+
+    def __init__(self, activities: list[Activity], counts: list[int] | None = None):
+        if counts is None:
+            counts = [1] * len(activities)
+
+        # One-time O(n log n) sort, activities without enjoyment never help
+        pairs = sorted(
+            ((a, c) for a, c in zip(activities, counts) if a.enjoyment > 0),
+            key=lambda pair: density(pair[0]),
+            reverse=True
+        )
+        self.activities = [a for a, _ in pairs]
+        self.counts = [c for _, c in pairs]
+
+        # Prefix sums let each bound be found with a binary search
+        self.prefix_times = [0]
+        self.prefix_enjoyments = [0]
+        for activity, count in pairs:
+            self.prefix_times.append(self.prefix_times[-1] + activity.time * count)
+            self.prefix_enjoyments.append(
+                self.prefix_enjoyments[-1] + activity.enjoyment * count
+            )
+
+    def upper_bound(self, capacity: int, start: int = 0) -> int:
+        """Return the fractional bound for the sorted activities from start onwards."""
+        target = self.prefix_times[start] + capacity
+
+        # Take whole activities while they fit, then a fraction of the next one
+        k = bisect_right(self.prefix_times, target, lo=start) - 1
+        bound = self.prefix_enjoyments[k] - self.prefix_enjoyments[start]
+
+        if k < len(self.activities):
+            activity = self.activities[k]
+            remaining = target - self.prefix_times[k]
+            bound += remaining * activity.enjoyment // activity.time
+
+        return bound
+
+def fractional_bound(event: Event) -> int:
+    """Return the fractional knapsack upper bound on an event's enjoyment."""
+    fitting = [a for a in event.activities if a.time <= event.max_time]
+    return FractionalBound(
+        fitting, [a.repeats for a in fitting]
+    ).upper_bound(event.max_time)
+
+def optimality_gap(
+    event: Event,
+    chosen: list[Activity],
+    bound: int | None = None
+) -> tuple[int, int, float]:
+    """Return the enjoyment, upper bound and relative optimality gap of a plan."""
+    if sum(a.time for a in chosen) > event.max_time:
+        raise ValueError("Plan exceeds the available time.")
+
+    if bound is None:
+        bound = fractional_bound(event)
+
+    enjoyment = sum(a.enjoyment for a in chosen)
+    gap = (bound - enjoyment) / bound if bound > 0 else 0.0
+
+    return enjoyment, bound, gap
@@ -0,0 +1,103 @@
+from array import array
+from pathlib import Path
+import hashlib
+import os
+import struct
+import sys
+import zlib
+
+from .classes import Event
+
+# Checkpoint file layout: magic, then a zlib compressed list of named fields.
+# Each field is a name, a kind (int, int list or bytes) and its data.
+CHECKPOINT_MAGIC = b"SSCK\x01"
+FIELD_HEADER = struct.Struct("<BcQ")
+
+def event_fingerprint(event: Event, solver: str) -> bytes:
+    """Return a digest identifying the solver and event a checkpoint belongs to."""
+    digest = hashlib.sha256(f"{solver}\n{event.max_time}\n".encode())
+    for activity in event.activities:
+        digest.update(
+            f"{activity.name} {activity.time} {activity.enjoyment} "
+            f"{activity.repeats}\n".encode()
+        )
+
+    # Rules in a canonical order, so equal constraints give equal digests
+    constraints = event.constraints
+    rules = (
+        sorted(constraints.mandatory),
+        sorted(constraints.excluded),
+        sorted(tuple(sorted(pair)) for pair in constraints.conflicts),
+        sorted((sorted(names), limit) for names, limit in constraints.groups),
+    )
+    digest.update(f"{rules!r}\n".encode())
+    return digest.digest()
+
+def save_checkpoint(path: Path, fields: dict[str, int | list[int] | bytes]) -> None:
+    """Atomically write solver state to a checkpoint file."""
+    parts = []
+    for name, value in fields.items():
+        if isinstance(value, int):
+            kind, data = b"i", struct.pack("<q", value)
+        elif isinstance(value, (bytes, bytearray)):
+            kind, data = b"b", bytes(value)
+        else:
+            values = array("q", value)
+            if sys.byteorder == "big":
+                values.byteswap()
+            kind, data = b"l", values.tobytes()
+
+        encoded_name = name.encode()
+        parts.append(FIELD_HEADER.pack(len(encoded_name), kind, len(data)))
+        parts.append(encoded_name)
+        parts.append(data)
+
+    # Write to a temporary file first so a kill mid-write keeps the old checkpoint
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(path.name + ".tmp")
+    temporary_path.write_bytes(CHECKPOINT_MAGIC + zlib.compress(b"".join(parts)))
+    os.replace(temporary_path, path)
+
+def load_checkpoint(path: Path) -> dict[str, int | list[int] | bytes]:
+    """Load solver state from a checkpoint file."""
+    data = path.read_bytes()
+
+    if not data.startswith(CHECKPOINT_MAGIC):
+        raise ValueError("Invalid checkpoint file.")
+
+    try:
+        payload = zlib.decompress(data[len(CHECKPOINT_MAGIC):])
+    except zlib.error as e:
+        raise ValueError("Invalid checkpoint file.") from e
+
+    fields = {}
+    offset = 0
+    try:
+        while offset < len(payload):
+            name_length, kind, data_length = FIELD_HEADER.unpack_from(payload, offset)
+            offset += FIELD_HEADER.size
+            name = payload[offset:offset + name_length].decode("utf-8")
+            offset += name_length
+            data = payload[offset:offset + data_length]
+            offset += data_length
+
+            # A truncated field is shorter than its header says
+            if offset > len(payload):
+                raise ValueError("Truncated field.")
+
+            if kind == b"i":
+                fields[name] = struct.unpack("<q", data)[0]
+            elif kind == b"b":
+                fields[name] = data
+            elif kind == b"l":
+                values = array("q")
+                values.frombytes(data)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                fields[name] = values.tolist()
+            else:
+                raise ValueError("Unknown field kind.")
+    except (struct.error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid checkpoint file.") from e
+
+    return fields
@@ -1,12 +1,22 @@
 class Activity:
     """Class for activities."""
 
-    def __init__(self, name: str, time: int, cost: int, enjoyment: int):
+    def __init__(
+        self,
+        name: str,
+        time: int,
+        cost: int,
+        enjoyment: int,
+        repeats: int = 1
+    ):
         self.name = name
         self.time = time
         self.cost = cost
         self.enjoyment = enjoyment
 
+        # How many times the activity can run, e.g. a repeated workshop
+        self.repeats = repeats
+
     # Custom __str__ method
     def __str__(self):
         return (
@@ -14,10 +24,50 @@ class Activity:
             f"£{self.cost}, enjoyment {self.enjoyment})"
         )
 
+class Constraints:
+    """Class for activity selection rules, referring to activities by name."""
+
+    def __init__(
+        self,
+        mandatory: set[str] | None = None,
+        excluded: set[str] | None = None,
+        conflicts: list[tuple[str, str]] | None = None,
+        groups: list[tuple[set[str], int]] | None = None
+    ):
+        # Activities that must be chosen, and activities that must not be
+        self.mandatory = mandatory if mandatory is not None else set()
+        self.excluded = excluded if excluded is not None else set()
+
+        # Pairs of activities that cannot both be chosen
+        self.conflicts = conflicts if conflicts is not None else []
+
+        # (names, limit) pairs where at most limit copies of the names can be chosen
+        self.groups = groups if groups is not None else []
+
+    # True if there are any rules to enforce
+    def __bool__(self):
+        return bool(self.mandatory or self.excluded or self.conflicts or self.groups)
+
 class Event:
     """Class for events."""
 
-    def __init__(self, max_time: int, max_budget: int, activities: list[Activity]):
+    def __init__(
+        self,
+        max_time: int,
+        max_budget: int,
+        activities: list[Activity],
+        windows: list[tuple[int, int]] | None = None,
+        constraints: Constraints | None = None
+    ):
         self.max_time = max_time
         self.max_budget = max_budget
         self.activities = activities
+
+        # (max_time, max_budget) per time window, e.g. one per day of the event
+        if windows is None:
+            windows = [(max_time, max_budget)]
+        self.windows = windows
+
+        if constraints is None:
+            constraints = Constraints()
+        self.constraints = constraints
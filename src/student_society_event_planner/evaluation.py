@@ -0,0 +1,134 @@
+import numpy as np
+
+from .classes import Activity, Event
+
+# Rows of candidate plans evaluated per matrix multiply, to bound memory use
+EVALUATION_CHUNK_ROWS = 8192
+
+def _plan_columns(event: Event) -> tuple[np.ndarray, np.ndarray]:
+    """Return the activity index and copy count that each plan column stands for.
+
+    Each activity has one column per bit of its repeat count, least significant
+    first, so a plan's count of an activity is written in binary. Activities
+    without repeats have a single column.
+    """
+    bit_lengths = [a.repeats.bit_length() for a in event.activities]
+    activity_index = np.repeat(np.arange(len(event.activities)), bit_lengths)
+    copies = np.concatenate(
+        [np.zeros(0, dtype=np.int64)]
+        + [1 << np.arange(bits, dtype=np.int64) for bits in bit_lengths]
+    )
+    return activity_index, copies
+
+def pack_plans(event: Event, plans: list[list[Activity]]) -> np.ndarray:
+    """Return candidate plans as a packed bitmask matrix, one row per plan.
+
+    Bit i of a row (little-endian within each byte) is set if the plan includes
+    event.activities[i], when no activity repeats. Otherwise the columns hold
+    each activity's count in binary, as laid out by _plan_columns.
+    """
+    index = {id(activity): i for i, activity in enumerate(event.activities)}
+    activity_index, copies = _plan_columns(event)
+    starts = np.searchsorted(activity_index, np.arange(len(event.activities)))
+
+    bits = np.zeros((len(plans), len(copies)), dtype=np.uint8)
+    for row, plan in enumerate(plans):
+        counts: dict[int, int] = {}
+        for activity in plan:
+            try:
+                i = index[id(activity)]
+            except KeyError as e:
+                raise ValueError("Plan contains an activity not in the event.") from e
+            counts[i] = counts.get(i, 0) + 1
+
+        for i, count in counts.items():
+            if count > event.activities[i].repeats:
+                raise ValueError(
+                    "Plan contains an activity more often than it repeats."
+                )
+
+            # Write the count in binary over the activity's columns
+            column = starts[i]
+            while count:
+                bits[row, column] = count & 1
+                count >>= 1
+                column += 1
+
+    return np.packbits(bits, axis=1, bitorder="little")
+
+def evaluate_plans(
+    event: Event,
+    packed_plans: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the feasibility, time, cost and enjoyment of every packed plan."""
+    activity_index, copies = _plan_columns(event)
+    columns_count = len(copies)
+    packed_plans = np.asarray(packed_plans, dtype=np.uint8)
+
+    if packed_plans.ndim != 2 or packed_plans.shape[1] != (columns_count + 7) // 8:
+        raise ValueError("Packed plans do not match the event's activities.")
+
+    # One column per total, so every plan is scored by a single matrix multiply
+    attributes = np.array(
+        [[a.time, a.cost, a.enjoyment] for a in event.activities], dtype=np.int64
+    ).reshape(len(event.activities), 3)
+    weights = attributes[activity_index] * copies[:, None]
+
+    # Floating point multiplies are much faster and exact while totals fit in 53 bits
+    largest_total = sum(
+        (abs(a.time) + abs(a.cost) + abs(a.enjoyment))
+        * ((1 << a.repeats.bit_length()) - 1)
+        for a in event.activities
+    )
+    if largest_total < 2**53:
+        weights = weights.astype(np.float64)
+
+    # Counts only need checking where the columns can hold more than the repeats
+    repeats = np.array([a.repeats for a in event.activities], dtype=np.int64)
+    bit_lengths = np.array([a.repeats.bit_length() for a in event.activities])
+    capped = np.flatnonzero((1 << bit_lengths) - 1 > repeats)
+    capped_starts = np.searchsorted(activity_index, capped)
+
+    # Narrow counts are much faster to add up, and enough for most repeat counts
+    count_type = np.int32 if bit_lengths.max(initial=0) < 31 else np.int64
+
+    # (columns, copies) per bit position, with activities that have run out of
+    # bits reading their first column with no copies
+    count_bits = []
+    for bit in range(bit_lengths[capped].max(initial=0)):
+        has_bit = bit_lengths[capped] > bit
+        count_bits.append((
+            np.where(has_bit, capped_starts + bit, capped_starts),
+            np.where(has_bit, 1 << bit, 0).astype(count_type)
+        ))
+
+    # Buffers are reused across chunks, as fresh arrays are slow to first write
+    counts_buffer = np.empty((EVALUATION_CHUNK_ROWS, len(capped)), dtype=count_type)
+    plane_buffer = np.empty_like(counts_buffer)
+    bits_buffer = np.empty((EVALUATION_CHUNK_ROWS, len(capped)), dtype=np.uint8)
+
+    totals = np.empty((packed_plans.shape[0], 3), dtype=np.int64)
+    over_repeats = np.zeros(packed_plans.shape[0], dtype=bool)
+    for start in range(0, packed_plans.shape[0], EVALUATION_CHUNK_ROWS):
+        chunk = packed_plans[start:start + EVALUATION_CHUNK_ROWS]
+        bits = np.unpackbits(chunk, axis=1, count=columns_count, bitorder="little")
+        totals[start:start + len(chunk)] = bits.astype(weights.dtype) @ weights
+
+        if len(capped):
+            # Add up each capped activity's count one bit position at a time
+            counts = counts_buffer[:len(chunk)]
+            plane = plane_buffer[:len(chunk)]
+            plane_bits = bits_buffer[:len(chunk)]
+            counts[:] = 0
+            for columns, bit_copies in count_bits:
+                np.take(bits, columns, axis=1, out=plane_bits)
+                np.multiply(plane_bits, bit_copies, out=plane)
+                counts += plane
+            over_repeats[start:start + len(chunk)] = \
+                (counts > repeats[capped]).any(axis=1)
+
+    times = totals[:, 0]
+    costs = totals[:, 1]
+    enjoyments = totals[:, 2]
+
+    return (times <= event.max_time) & ~over_repeats, times, costs, enjoyments
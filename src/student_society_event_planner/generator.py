@@ -0,0 +1,136 @@
+from array import array
+from pathlib import Path
+import argparse
+import random
+import sys
+
+from .classes import Activity, Event
+from .utils import BINARY_HEADER, BINARY_MAGIC, BINARY_SUFFIX
+
+# Enjoyment distributions, following the classic knapsack instance families
+KINDS = ("uncorrelated", "correlated", "strongly_correlated", "subset_sum")
+
+def generate_event(
+    activity_count: int,
+    kind: str = "uncorrelated",
+    seed: int = 0,
+    value_range: int = 100,
+    capacity_ratio: float = 0.5,
+    max_time: int | None = None,
+    max_repeats: int = 1
+) -> Event:
+    """Generate a deterministic random event for the given seed."""
+    if kind not in KINDS:
+        raise ValueError(f"Unknown kind: {kind}")
+    if activity_count <= 0:
+        raise ValueError("Non-positive activity count.")
+    if value_range <= 0:
+        raise ValueError("Non-positive value range.")
+
+    rng = random.Random(seed)
+    spread = max(1, value_range // 10)
+
+    activities = []
+    for i in range(activity_count):
+        time = rng.randint(1, value_range)
+        cost = rng.randint(0, value_range)
+
+        if kind == "uncorrelated":
+            enjoyment = rng.randint(1, value_range)
+        elif kind == "correlated":
+            enjoyment = max(1, time + rng.randint(-spread, spread))
+        elif kind == "strongly_correlated":
+            enjoyment = time + spread
+        else:
+            enjoyment = time
+
+        # Only draw repeat counts when asked, so existing seeds are unchanged
+        repeats = rng.randint(1, max_repeats) if max_repeats > 1 else 1
+
+        activities.append(
+            Activity(f"Activity-{i + 1}", time, cost, enjoyment, repeats)
+        )
+
+    # Capacities default to a fixed fraction of the totals
+    if max_time is None:
+        max_time = int(capacity_ratio * sum(a.time for a in activities))
+    max_budget = int(capacity_ratio * sum(a.cost for a in activities))
+
+    return Event(max_time, max_budget, activities)
+
+def write_event_file(event: Event, path: Path) -> None:
+    """Write an event in the text input file format."""
+    lines = [str(len(event.activities)), f"{event.max_time} {event.max_budget}"]
+    lines.extend(
+        f"{a.name} {a.time} {a.cost} {a.enjoyment}"
+        + (f" {a.repeats}" if a.repeats != 1 else "")
+        for a in event.activities
+    )
+    path.write_text("\n".join(lines) + "\n")
+
+def write_event_binary(event: Event, path: Path) -> None:
+    """Write an event in the binary input file format."""
+    activities = event.activities
+    header = BINARY_HEADER.pack(
+        BINARY_MAGIC, 2, len(activities), event.max_time, event.max_budget
+    )
+
+    columns = []
+    for values in (
+        [a.time for a in activities],
+        [a.cost for a in activities],
+        [a.enjoyment for a in activities],
+        [a.repeats for a in activities]
+    ):
+        column = array("q", values)
+        if sys.byteorder == "big":
+            column.byteswap()
+        columns.append(column.tobytes())
+
+    names = "\n".join(a.name for a in activities).encode("utf-8")
+    path.write_bytes(header + b"".join(columns) + names)
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line input."""
+    arg_parser = argparse.ArgumentParser(
+        description="Generate a synthetic event input file."
+    )
+    arg_parser.add_argument("output_file")
+    arg_parser.add_argument("-n", "--count", type=int, default=1000)
+    arg_parser.add_argument("-k", "--kind", choices=KINDS, default="uncorrelated")
+    arg_parser.add_argument("-s", "--seed", type=int, default=0)
+    arg_parser.add_argument("-r", "--range", type=int, default=100, dest="value_range")
+    arg_parser.add_argument("-c", "--capacity-ratio", type=float, default=0.5)
+    arg_parser.add_argument("-t", "--max-time", type=int, default=None)
+    arg_parser.add_argument("-m", "--max-repeats", type=int, default=1)
+    arg_parser.add_argument(
+        "-b", "--binary", action="store_true",
+        help="also write the binary equivalent alongside the text file"
+    )
+    return arg_parser.parse_args()
+
+def main() -> None:
+    """Run the generator from the command line."""
+    args = parse_args()
+
+    event = generate_event(
+        args.count,
+        args.kind,
+        args.seed,
+        args.value_range,
+        args.capacity_ratio,
+        args.max_time,
+        args.max_repeats
+    )
+
+    path = Path(args.output_file)
+    write_event_file(event, path)
+    print(f"Wrote {path}")
+
+    if args.binary:
+        binary_path = path.with_suffix(BINARY_SUFFIX)
+        write_event_binary(event, binary_path)
+        print(f"Wrote {binary_path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+from typing import TextIO
+import csv
+import json
+
+from .classes import Activity, Event
+
+class Report:
+    """Columnar results of a single solver run."""
+
+    def __init__(
+        self,
+        solver: str,
+        title: str,
+        chosen: list[Activity],
+        enjoyment: int,
+        time_used: int,
+        execution_time: float
+    ):
+        self.solver = solver
+        self.title = title
+        self.enjoyment = enjoyment
+        self.time_used = time_used
+        self.execution_time = execution_time
+
+        # One column per activity attribute, so writers can serialise in bulk
+        self.names = [a.name for a in chosen]
+        self.times = [a.time for a in chosen]
+        self.costs = [a.cost for a in chosen]
+        self.enjoyments = [a.enjoyment for a in chosen]
+
+class TextWriter:
+    """Write human readable results, matching the original terminal output."""
+
+    def __init__(self, stream: TextIO, quiet: bool = False):
+        self.stream = stream
+        self.quiet = quiet
+
+    def write_header(self, input_file: str, event: Event) -> None:
+        """Write the event details."""
+        self.stream.write(
+            "========================================\n"
+            "EVENT PLANNER - RESULTS\n"
+            "========================================\n\n"
+            f"Input File: {input_file}\n"
+            f"Available Time: {event.max_time} hours\n"
+            f"Available Budget: £{event.max_budget}\n"
+            "Constraint: Time\n"
+        )
+
+    def write_report(self, report: Report) -> None:
+        """Write the results of one solver."""
+        self.stream.write(f"\n--- {report.title} ALGORITHM ---\n")
+
+        if not self.quiet:
+            activity_lines = "\n".join(map(
+                "- {} ({} hours, £{}, enjoyment {})".format,
+                report.names, report.times, report.costs, report.enjoyments
+            ))
+            self.stream.write(f"Selected Activities:\n{activity_lines}\n\n")
+
+        self.stream.write(
+            f"Total Enjoyment: {report.enjoyment}\n"
+            f"Total Time Used: {report.time_used} hours\n\n"
+            f"Execution Time: {report.execution_time:.5f} seconds\n"
+        )
+
+class JsonLinesWriter:
+    """Write one JSON object for the event and one per solver run."""
+
+    def __init__(self, stream: TextIO, quiet: bool = False):
+        self.stream = stream
+        self.quiet = quiet
+
+    def write_header(self, input_file: str, event: Event) -> None:
+        """Write the event details."""
+        self.stream.write(json.dumps({
+            "input_file": str(input_file),
+            "max_time": event.max_time,
+            "max_budget": event.max_budget,
+        }) + "\n")
+
+    def write_report(self, report: Report) -> None:
+        """Write the results of one solver, with the activities as columns."""
+        record = {
+            "solver": report.solver,
+            "enjoyment": report.enjoyment,
+            "time_used": report.time_used,
+            "execution_time": report.execution_time,
+        }
+
+        if not self.quiet:
+            record["activities"] = {
+                "name": report.names,
+                "time": report.times,
+                "cost": report.costs,
+                "enjoyment": report.enjoyments,
+            }
+
+        self.stream.write(json.dumps(record) + "\n")
+
+class CsvWriter:
+    """Write one row per chosen activity, or one row per solver when quiet.
+
+    Activity rows also carry their solver's metrics, and a solver that chooses
+    nothing still writes a row with empty activity columns.
+    """
+
+    def __init__(self, stream: TextIO, quiet: bool = False):
+        self.stream = stream
+        self.quiet = quiet
+        self.writer = csv.writer(stream, lineterminator="\n")
+
+    def write_header(self, input_file: str, event: Event) -> None:
+        """Write the column names."""
+        if self.quiet:
+            self.writer.writerow(
+                ["solver", "enjoyment", "time_used", "execution_time"]
+            )
+        else:
+            self.writer.writerow([
+                "solver",
+                "name",
+                "time",
+                "cost",
+                "enjoyment",
+                "total_enjoyment",
+                "time_used",
+                "execution_time"
+            ])
+
+    def write_report(self, report: Report) -> None:
+        """Write the results of one solver."""
+        metrics = [report.enjoyment, report.time_used, f"{report.execution_time:.5f}"]
+
+        if self.quiet:
+            self.writer.writerow([report.solver, *metrics])
+        elif not report.names:
+            self.writer.writerow([report.solver, "", "", "", "", *metrics])
+        else:
+            rows = len(report.names)
+            self.writer.writerows(zip(
+                [report.solver] * rows,
+                report.names,
+                report.times,
+                report.costs,
+                report.enjoyments,
+                *([metric] * rows for metric in metrics)
+            ))
+
+# Output formats available to the command line
+WRITERS = {
+    "text": TextWriter,
+    "jsonl": JsonLinesWriter,
+    "csv": CsvWriter,
+}
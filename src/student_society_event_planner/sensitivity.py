@@ -0,0 +1,98 @@
+from .algorithms import _split_counts, bottom_up
+from .classes import Activity, Event
+
+class ActivitySensitivity:
+    """Class for how far an activity's values are from changing the plan."""
+
+    def __init__(
+        self,
+        activity: Activity,
+        included: bool,
+        enjoyment_threshold: int | None,
+        time_threshold: int
+    ):
+        self.activity = activity
+
+        # Whether bottom_up's plan includes the activity
+        self.included = included
+
+        # The activity is in an optimal plan if its enjoyment is at least this,
+        # and in every optimal plan if it is more. None if it can never fit.
+        # For a repeated activity, these are for one copy with the rest unchanged.
+        self.enjoyment_threshold = enjoyment_threshold
+
+        # The longest time the activity can take and still be in an optimal plan
+        self.time_threshold = time_threshold
+
+def _add_activity(row: list[int], activity: Activity, copies: int = 1) -> list[int]:
+    """Return a new DP row with up to the given copies of the activity available."""
+    row = row.copy()
+    for count in _split_counts(copies):
+        item_time = activity.time * count
+        item_enjoyment = activity.enjoyment * count
+        for j in range(len(row) - 1, item_time - 1, -1):
+            enjoyment_count = row[j - item_time] + item_enjoyment
+            if enjoyment_count > row[j]:
+                row[j] = enjoyment_count
+    return row
+
+def _combine(prefix: list[int], suffix: list[int], capacity: int) -> int:
+    """Return the best enjoyment of the two halves sharing a capacity."""
+    return max(prefix[c] + suffix[capacity - c] for c in range(capacity + 1))
+
+def sensitivity(event: Event, time_limit: float) -> list[ActivitySensitivity]:
+    """Return the enjoyment and time thresholds of every activity in one pass.
+
+    The prefix DP rows are built once and the suffix rows are rolled backwards,
+    so each activity is compared against the best plan without it in O(T log T)
+    instead of a full re-solve. One copy of a repeated activity is compared
+    against every other activity and the rest of its own copies.
+    """
+    if event.constraints:
+        raise ValueError("Sensitivity analysis does not support constraints.")
+
+    activities = event.activities
+    max_time = event.max_time
+    chosen_ids = {id(activity) for activity in bottom_up(event, time_limit)[0]}
+
+    # prefix[i] is the DP row for the activities before i
+    prefix = [[0] * (max_time + 1)]
+    for activity in activities[:-1]:
+        prefix.append(_add_activity(prefix[-1], activity, activity.repeats))
+
+    results = []
+    suffix = [0] * (max_time + 1)
+    for i in range(len(activities) - 1, -1, -1):
+        activity = activities[i]
+        before = _add_activity(prefix[i], activity, activity.repeats - 1)
+
+        # Best enjoyment of every other activity with the full time available
+        without = _combine(before, suffix, max_time)
+
+        enjoyment_threshold = None
+        if activity.time <= max_time:
+            enjoyment_threshold = without - _combine(
+                before, suffix, max_time - activity.time
+            )
+
+        # Binary search for the longest time that keeps the activity worthwhile,
+        # as the best plan including it only gets worse as its time grows
+        low = 0
+        high = max_time
+        while low < high:
+            middle = (low + high + 1) // 2
+            including = activity.enjoyment + _combine(before, suffix, max_time - middle)
+            if including >= without:
+                low = middle
+            else:
+                high = middle - 1
+
+        results.append(ActivitySensitivity(
+            activity, id(activity) in chosen_ids, enjoyment_threshold, low
+        ))
+
+        suffix = _add_activity(suffix, activity, activity.repeats)
+        del prefix[i]
+
+    results.reverse()
+    return results
@@ -1,12 +1,37 @@
+from array import array
 from pathlib import Path
 import argparse
+import struct
+import sys
 
 from .classes import Activity, Event
 
+# Binary event file layout: header, then int64 times, costs and enjoyments,
+# (and repeats from version 2) then the newline separated UTF-8 activity names
+BINARY_MAGIC = b"SSEP"
+BINARY_SUFFIX = ".bin"
+BINARY_HEADER = struct.Struct("<4sBqqq")
+
 def parse_args() -> argparse.Namespace:
     """Parse the command line input."""
     arg_parser = argparse.ArgumentParser()
     arg_parser.add_argument("input_file")
+    arg_parser.add_argument(
+        "-f", "--format", choices=["text", "jsonl", "csv"], default="text",
+        help="output format for the results"
+    )
+    arg_parser.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="only output the metrics, not the selected activities"
+    )
+    arg_parser.add_argument(
+        "--checkpoint", action="store_true",
+        help="periodically save solver progress to the checkpoints directory"
+    )
+    arg_parser.add_argument(
+        "--resume", action="store_true",
+        help="resume from saved solver progress, and keep saving it"
+    )
     return arg_parser.parse_args()
 
 def load_event_file(file_name: str) -> Event:
@@ -16,6 +41,10 @@ def load_event_file(file_name: str) -> Event:
     if not path.is_file():
         raise FileNotFoundError(f"Input file does not exist: {path}")
 
+    # Binary event files are read directly into arrays
+    if path.suffix == BINARY_SUFFIX:
+        return load_event_binary(path)
+
     with open(path) as f:
         lines = [line.strip() for line in f.read().splitlines()]
 
@@ -43,11 +72,20 @@ def load_event_file(file_name: str) -> Event:
             # Check that there are the correct number of activities
             if len(lines[2:activity_count+2]) == activity_count:
                 for activity_line in lines[2:activity_count+2]:
-                    name, time, cost, enjoyment = activity_line.split()
+                    fields = activity_line.split()
+
+                    # The repeat count is optional and defaults to 1
+                    if len(fields) == 4:
+                        fields.append("1")
+                    name, time, cost, enjoyment, repeats = fields
+                    if int(repeats) <= 0:
+                        raise ValueError
 
                     # Create an Activity object for each activity line
                     activities.append(
-                        Activity(name, int(time), int(cost), int(enjoyment))
+                        Activity(
+                            name, int(time), int(cost), int(enjoyment), int(repeats)
+                        )
                     )
             else:
                 raise ValueError
@@ -56,3 +94,53 @@ def load_event_file(file_name: str) -> Event:
 
         # Return an Event object
         return Event(max_time, max_budget, activities)
+
+def _int64_array(data: bytes) -> array:
+    """Return a little-endian int64 buffer as an array."""
+    values = array("q")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def load_event_binary(path: Path) -> Event:
+    """Load an event from a binary event file."""
+    data = path.read_bytes()
+
+    try:
+        magic, version, activity_count, max_time, max_budget = \
+            BINARY_HEADER.unpack_from(data)
+    except struct.error as e:
+        raise ValueError("Invalid binary header.") from e
+
+    if magic != BINARY_MAGIC or version not in (1, 2):
+        raise ValueError("Invalid binary header.")
+    if activity_count <= 0:
+        raise ValueError("Non-positive activity count.")
+    if max_time < 0 or max_budget < 0:
+        raise ValueError("Non-positive constraint(s).")
+
+    # Read the activity columns and the names block
+    offset = BINARY_HEADER.size
+    column_size = activity_count * 8
+    column_count = 3 if version == 1 else 4
+    if len(data) < offset + column_count * column_size:
+        raise ValueError("Invalid activities.")
+
+    columns = [
+        _int64_array(data[offset + k * column_size:offset + (k + 1) * column_size])
+        for k in range(column_count)
+    ]
+    if version == 1:
+        columns.append([1] * activity_count)
+    names = data[offset + column_count * column_size:].decode("utf-8").split("\n")
+
+    if len(names) != activity_count or min(columns[3]) <= 0:
+        raise ValueError("Invalid activities.")
+
+    activities = [
+        Activity(name, time, cost, enjoyment, repeats)
+        for name, time, cost, enjoyment, repeats in zip(names, *columns)
+    ]
+
+    return Event(max_time, max_budget, activities)
@@ -2,7 +2,9 @@
 Shared helper functions for testing algorithms.
 """
 
-from student_society_event_planner.classes import Activity, Event
+import random
+
+from student_society_event_planner.classes import Activity, Constraints, Event
 
 
 def _names(chosen):
@@ -22,10 +24,35 @@ def _names(chosen):
     return sorted(a.name for a in chosen)
 
 
+def _satisfies(chosen: list[Activity], constraints: Constraints) -> bool:
+    """Return whether a choice of activities keeps to every constraint.
+
+    Args:
+        chosen: List of Activity objects, with repeats listed once per copy
+        constraints: Constraints object to check against
+
+    Returns:
+        True if no rule is broken
+
+    """
+    names = [a.name for a in chosen]
+    return (
+        constraints.mandatory <= set(names)
+        and not constraints.excluded & set(names)
+        and not any(a in names and b in names for a, b in constraints.conflicts)
+        and all(
+            sum(name in group for name in names) <= limit
+            for group, limit in constraints.groups
+        )
+    )
+
+
 def _reference_exhaustive(event: Event) -> tuple[list[Activity], int, int]:
     """Small, clear reference implementation for correctness checks.
 
-    Enumerates all subsets and returns (chosen, enjoyment, time_used).
+    Enumerates all subsets that satisfy the event's constraints, with each
+    repeat of an activity as its own copy, and returns
+    (chosen, enjoyment, time_used).
     Tie-break: prefer smaller time_used, then lexicographically smaller names.
 
     Note: This is intentionally different from the recursive solver's tie-break.
@@ -42,23 +69,25 @@ def _reference_exhaustive(event: Event) -> tuple[list[Activity], int, int]:
         This function has O(2^n) complexity and should only be used
         for testing with small values of n (typically n <= 20).
     """
+    # The empty plan is only a fallback if it keeps to the constraints
     best_chosen: list[Activity] = []
-    best_enjoyment = 0
+    best_enjoyment = -1
     best_time = 0
 
-    n = len(event.activities)
+    activities = [a for a in event.activities for _ in range(a.repeats)]
+    n = len(activities)
     for mask in range(1 << n):
         time_used = 0
         enjoyment = 0
         chosen: list[Activity] = []
         for i in range(n):
             if mask & (1 << i):
-                a = event.activities[i]
+                a = activities[i]
                 time_used += a.time
                 enjoyment += a.enjoyment
                 chosen.append(a)
 
-        if time_used <= event.max_time:
+        if time_used <= event.max_time and _satisfies(chosen, event.constraints):
             if enjoyment > best_enjoyment:
                 best_chosen, best_enjoyment, best_time = chosen, enjoyment, time_used
             elif enjoyment == best_enjoyment:
@@ -108,4 +137,97 @@ def _reference_optimum(event: Event) -> tuple[list[Activity], int, int]:
                 best_enjoyment = enjoyment
                 best_time = time_used
 
-    return best_choice, best_enjoyment, best_time
\ No newline at end of file
+    return best_choice, best_enjoyment, best_time
+
+EVENT_KINDS = (
+    "uniform",
+    "ties",
+    "zero_enjoyment",
+    "zero_time",
+    "duplicates",
+    "huge_capacity",
+    "repeats",
+    "constraints",
+)
+
+
+def _random_event(rng: random.Random, kind: str, max_n: int = 10) -> Event:
+    """Generate a seeded random event, optionally shaped to stress tie-breaks.
+
+    Args:
+        rng: random.Random instance used for every draw
+        kind: One of EVENT_KINDS
+        max_n: Largest number of activities to generate
+
+    Returns:
+        Event object with between 1 and max_n activities
+
+    """
+    n = rng.randint(1, max_n)
+    max_time = rng.randint(0, 20)
+
+    def draw(i: int) -> Activity:
+        return Activity(
+            name=f"A{i}",
+            time=rng.randint(1, 7),
+            cost=rng.randint(0, 200),
+            enjoyment=rng.randint(0, 250),
+        )
+
+    if kind == "ties":
+        # Few distinct values so many subsets share the same enjoyment
+        activities = [
+            Activity(f"A{i}", rng.randint(1, 3), 0, rng.choice([10, 20, 30]))
+            for i in range(n)
+        ]
+    elif kind == "zero_enjoyment":
+        activities = [draw(i) for i in range(n)]
+        for a in activities:
+            if rng.random() < 0.5:
+                a.enjoyment = 0
+    elif kind == "zero_time":
+        activities = [draw(i) for i in range(n)]
+        for a in activities:
+            if rng.random() < 0.4:
+                a.time = 0
+    elif kind == "duplicates":
+        template = [draw(i) for i in range(rng.randint(1, 3))]
+        activities = [
+            Activity(f"A{i}", t.time, t.cost, t.enjoyment)
+            for i, t in enumerate(rng.choice(template) for _ in range(n))
+        ]
+    elif kind == "huge_capacity":
+        activities = [
+            Activity(f"A{i}", rng.randint(100, 5000), 0, rng.randint(0, 1000))
+            for i in range(n)
+        ]
+        max_time = rng.randint(0, 20000)
+    elif kind == "repeats":
+        # Fewer activities, as each repeat is another copy for the reference
+        activities = [draw(i) for i in range(rng.randint(1, max(1, max_n // 3)))]
+        for a in activities:
+            a.repeats = rng.randint(1, 4)
+    elif kind == "constraints":
+        activities = [draw(i) for i in range(n)]
+        for a in activities:
+            if rng.random() < 0.2:
+                a.repeats = 2
+        names = [a.name for a in activities]
+
+        # At most one mandatory activity that fits, so the rules can always be met
+        fitting = [a.name for a in activities if a.time <= max_time]
+        mandatory = set(rng.sample(fitting, min(len(fitting), rng.randint(0, 1))))
+        excluded = set(rng.sample(names, rng.randint(0, 1))) - mandatory
+        conflicts = [
+            tuple(rng.sample(names, 2)) for _ in range(rng.randint(0, 3))
+        ] if n >= 2 else []
+        groups = [
+            (set(rng.sample(names, rng.randint(1, n))), rng.randint(1, 3))
+            for _ in range(rng.randint(0, 2))
+        ]
+        constraints = Constraints(mandatory, excluded, conflicts, groups)
+        return Event(max_time, 0, activities, constraints=constraints)
+    else:
+        activities = [draw(i) for i in range(n)]
+
+    return Event(max_time=max_time, max_budget=0, activities=activities)
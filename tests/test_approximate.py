@@ -0,0 +1,106 @@
+from collections import Counter
+import random
+
+import pytest
+
+from student_society_event_planner.algorithms import fptas, greedy
+from student_society_event_planner.classes import Activity, Event
+from student_society_event_planner.utils import load_event_file
+
+from .helpers import EVENT_KINDS, _random_event, _reference_exhaustive
+
+# The approximate solvers reject constraints
+KINDS = [kind for kind in EVENT_KINDS if kind != "constraints"]
+
+
+@pytest.mark.parametrize("solver", [greedy, fptas])
+def test_approximation_respects_reported_bound_on_random_instances(solver):
+    """Every result must be feasible and within its reported guarantee."""
+    rng = random.Random(31)
+
+    for trial in range(100):
+        event = _random_event(rng, KINDS[trial % len(KINDS)], max_n=12)
+
+        _, ref_enjoyment, _ = _reference_exhaustive(event)
+        chosen, enjoyment, time_used, guarantee = solver(event, time_limit=1.0)
+
+        assert time_used <= event.max_time, f"Trial {trial}: Time constraint violated"
+        assert time_used == sum(a.time for a in chosen), f"Trial {trial}: Time mismatch"
+        assert enjoyment == sum(a.enjoyment for a in chosen), \
+            f"Trial {trial}: Enjoyment mismatch"
+        assert all(
+            count <= a.repeats for a, count in Counter(chosen).items()
+        ), f"Trial {trial}: Activity chosen more often than it repeats"
+        assert enjoyment >= guarantee * ref_enjoyment, \
+            f"Trial {trial}: {enjoyment} below {guarantee} * {ref_enjoyment}"
+
+
+def test_greedy_uses_best_single_activity_when_better():
+    """A single long, valuable activity should beat a dense but tiny one."""
+    event = Event(
+        max_time=10,
+        max_budget=0,
+        activities=[
+            Activity("Tiny", 1, 0, 2),
+            Activity("Long", 10, 0, 10),
+        ],
+    )
+
+    chosen, enjoyment, time_used, guarantee = greedy(event, time_limit=1.0)
+
+    assert [a.name for a in chosen] == ["Long"]
+    assert enjoyment == 10
+    assert time_used == 10
+    assert guarantee == 0.5
+
+
+@pytest.mark.parametrize("epsilon", [0.5, 0.1, 0.01])
+def test_fptas_reports_epsilon_guarantee(epsilon):
+    """The FPTAS guarantee is 1 - epsilon."""
+    event = load_event_file("input_100.txt")
+
+    _, _, _, guarantee = fptas(event, time_limit=1.0, epsilon=epsilon)
+
+    assert guarantee == pytest.approx(1 - epsilon)
+
+
+@pytest.mark.parametrize("epsilon", [0, 1, -0.5])
+def test_fptas_rejects_invalid_epsilon(epsilon):
+    event = load_event_file("input_small.txt")
+
+    with pytest.raises(ValueError):
+        fptas(event, time_limit=1.0, epsilon=epsilon)
+
+
+@pytest.mark.parametrize("solver", [greedy, fptas])
+def test_approximation_returns_empty_when_no_activity_fits(solver):
+    event = Event(
+        max_time=1,
+        max_budget=999,
+        activities=[
+            Activity("Too-Long-1", 2, 10, 10),
+            Activity("Too-Long-2", 3, 20, 100),
+        ],
+    )
+
+    chosen, enjoyment, time_used, _ = solver(event, time_limit=1.0)
+
+    assert chosen == []
+    assert enjoyment == 0
+    assert time_used == 0
+
+
+@pytest.mark.parametrize("solver", [greedy, fptas])
+def test_approximation_takes_every_repeat(solver):
+    """Repeats are copies, so the guarantee is against the repeated optimum."""
+    event = Event(
+        max_time=6,
+        max_budget=0,
+        activities=[Activity("W", 2, 0, 10, repeats=3)],
+    )
+
+    chosen, enjoyment, time_used, _ = solver(event, time_limit=1.0)
+
+    assert [a.name for a in chosen] == ["W", "W", "W"]
+    assert enjoyment == 30
+    assert time_used == 6
@@ -0,0 +1,121 @@
+import random
+import time
+
+import pytest
+
+from student_society_event_planner.algorithms import bottom_up, multi_window
+from student_society_event_planner.bounds import (
+    FractionalBound,
+    fractional_bound,
+    optimality_gap,
+)
+from student_society_event_planner.classes import Activity, Event
+from student_society_event_planner.utils import load_event_file
+import student_society_event_planner.algorithms as algorithms
+
+from .helpers import EVENT_KINDS, _random_event, _reference_exhaustive
+
+
+def test_fractional_bound_is_an_upper_bound_on_random_events():
+    rng = random.Random(17)
+
+    for trial in range(300):
+        event = _random_event(rng, EVENT_KINDS[trial % len(EVENT_KINDS)])
+        _, ref_enjoyment, _ = _reference_exhaustive(event)
+
+        assert fractional_bound(event) >= ref_enjoyment, f"Trial {trial}"
+
+
+def test_fractional_bound_takes_a_fraction_of_the_next_activity():
+    event = Event(
+        max_time=5,
+        max_budget=0,
+        activities=[
+            Activity("A", 2, 0, 40),
+            Activity("B", 4, 0, 60),
+            Activity("C", 1, 0, 5),
+        ],
+    )
+
+    # A whole, then 3 of B's 4 hours
+    assert fractional_bound(event) == 40 + 45
+
+
+def test_upper_bound_from_start_matches_suffix_bound():
+    """Bounds from an offset equal the bound of the remaining activities."""
+    rng = random.Random(4)
+    activities = [
+        Activity(f"A{i}", rng.randint(0, 9), 0, rng.randint(0, 90)) for i in range(40)
+    ]
+    bound = FractionalBound(activities)
+
+    for start in range(len(bound.activities) + 1):
+        suffix = FractionalBound(bound.activities[start:])
+        for capacity in (0, 1, 7, 30, 500):
+            assert bound.upper_bound(capacity, start) == suffix.upper_bound(capacity)
+
+
+def test_counts_match_bounds_over_written_out_copies():
+    rng = random.Random(9)
+    activities = [
+        Activity(f"A{i}", rng.randint(0, 9), 0, rng.randint(0, 90)) for i in range(30)
+    ]
+    counts = [rng.randint(1, 5) for _ in activities]
+
+    bound = FractionalBound(activities, counts)
+    copies = FractionalBound(
+        [a for a, count in zip(activities, counts) for _ in range(count)]
+    )
+
+    for capacity in (0, 1, 7, 30, 500):
+        assert bound.upper_bound(capacity) == copies.upper_bound(capacity)
+
+
+def test_fractional_bound_does_not_write_out_repeats():
+    """Building the bound costs O(n log n) whatever the repeat counts."""
+    event = Event(10, 0, [Activity("W", 1, 0, 5, repeats=3_000_000)])
+
+    start = time.perf_counter()
+    assert fractional_bound(event) == 50
+    assert time.perf_counter() - start < 0.1
+
+
+def test_optimality_gap_of_optimal_and_partial_plans():
+    event = load_event_file("input_100.txt")
+    chosen, enjoyment, _ = bottom_up(event, time_limit=10.0)
+
+    optimal_enjoyment, bound, gap = optimality_gap(event, chosen)
+    assert optimal_enjoyment == enjoyment
+    assert bound >= enjoyment
+    assert 0 <= gap < 0.05
+
+    _, _, partial_gap = optimality_gap(event, chosen[: len(chosen) // 2], bound)
+    assert partial_gap > gap
+
+
+def test_optimality_gap_rejects_infeasible_plan():
+    event = load_event_file("input_small.txt")
+
+    with pytest.raises(ValueError):
+        optimality_gap(event, event.activities)
+
+
+def test_multi_window_with_fractional_bounds(monkeypatch):
+    """The search must stay optimal when the shared DP cache is too large."""
+    monkeypatch.setattr(algorithms, "MAX_BOUND_CACHE_CELLS", 0)
+    event = Event(
+        max_time=6,
+        max_budget=0,
+        activities=[
+            Activity("A", 4, 0, 40),
+            Activity("B", 3, 0, 33),
+            Activity("C", 3, 0, 33),
+            Activity("D", 2, 0, 20),
+            Activity("E", 2, 0, 20),
+        ],
+        windows=[(6, 0), (6, 0)],
+    )
+
+    _, enjoyment, _, proven = multi_window(event, time_limit=10.0)
+
+    assert enjoyment == 126
@@ -0,0 +1,165 @@
+import random
+import zlib
+
+import pytest
+
+from student_society_event_planner.algorithms import (
+    bottom_up,
+    bruteforce,
+    resumable_bottom_up,
+    resumable_bruteforce,
+)
+from student_society_event_planner.checkpoint import (
+    CHECKPOINT_MAGIC,
+    event_fingerprint,
+    load_checkpoint,
+    save_checkpoint,
+)
+from student_society_event_planner.classes import Activity, Constraints, Event
+from student_society_event_planner.utils import load_event_file
+
+from .helpers import EVENT_KINDS, _random_event
+
+
+def _solve_with_interruptions(solver, event, path):
+    """Keep resuming a solver with no time to spare until it finishes."""
+    calls = 0
+    while True:
+        calls += 1
+        result = solver(event, 0.0, path, interval=0.0)
+        if not path.exists():
+            return result, calls
+
+
+def test_checkpoint_round_trip(tmp_path):
+    path = tmp_path / "state.ckpt"
+    fields = {
+        "count": -12,
+        "row": [0, 5, 2**40, -3],
+        "bits": b"\x00\xff\x10",
+        "empty": [],
+    }
+
+    save_checkpoint(path, fields)
+
+    assert load_checkpoint(path) == fields
+
+
+def test_load_checkpoint_rejects_invalid_file(tmp_path):
+    path = tmp_path / "state.ckpt"
+    path.write_bytes(b"not a checkpoint")
+
+    with pytest.raises(ValueError):
+        load_checkpoint(path)
+
+
+@pytest.mark.parametrize("cut", [1, 5, 13, 20])
+def test_load_checkpoint_rejects_truncated_payload(tmp_path, cut):
+    """A payload cut short inside a field is invalid, not a struct error."""
+    path = tmp_path / "state.ckpt"
+    save_checkpoint(path, {"count": 3, "row": [1, 2, 3]})
+    payload = zlib.decompress(path.read_bytes()[len(CHECKPOINT_MAGIC):])
+    path.write_bytes(CHECKPOINT_MAGIC + zlib.compress(payload[:-cut]))
+
+    with pytest.raises(ValueError, match="Invalid checkpoint file."):
+        load_checkpoint(path)
+
+
+@pytest.mark.parametrize("resumable", [resumable_bruteforce, resumable_bottom_up])
+def test_resume_rejects_checkpoint_with_missing_fields(tmp_path, resumable):
+    path = tmp_path / "solve.ckpt"
+    event = load_event_file("input_large.txt")
+
+    resumable(event, 0.0, path, interval=0.0)
+    fields = load_checkpoint(path)
+    save_checkpoint(path, {"fingerprint": fields["fingerprint"]})
+
+    with pytest.raises(ValueError, match="Invalid checkpoint file."):
+        resumable(event, 0.0, path)
+
+
+@pytest.mark.parametrize(
+    ("solver", "resumable", "kinds"),
+    [
+        (bruteforce, resumable_bruteforce, EVENT_KINDS),
+        (
+            bottom_up,
+            resumable_bottom_up,
+            [kind for kind in EVENT_KINDS if kind != "constraints"],
+        ),
+    ],
+)
+def test_resumable_solvers_match_originals_on_random_events(solver, resumable, kinds):
+    """Without a checkpoint the resumable solvers return identical results."""
+    rng = random.Random(77)
+
+    for trial in range(120):
+        event = _random_event(rng, kinds[trial % len(kinds)])
+
+        expected = solver(event, time_limit=10.0)
+        result = resumable(event, time_limit=10.0)
+
+        assert result == expected, f"Trial {trial}"
+
+
+@pytest.mark.parametrize(
+    ("solver", "resumable", "fname"),
+    [
+        (bruteforce, resumable_bruteforce, "input_large.txt"),
+        (bottom_up, resumable_bottom_up, "input_1000.txt"),
+    ],
+)
+def test_interrupted_solve_resumes_to_the_same_result(
+    tmp_path, solver, resumable, fname
+):
+    event = load_event_file(fname)
+    path = tmp_path / "solve.ckpt"
+
+    result, calls = _solve_with_interruptions(resumable, event, path)
+
+    assert calls > 1, "Expected the solve to be interrupted at least once"
+    assert result == solver(event, time_limit=10.0)
+
+
+def test_resume_rejects_checkpoint_for_another_event(tmp_path):
+    path = tmp_path / "solve.ckpt"
+    event = load_event_file("input_1000.txt")
+    other = Event(5, 0, [Activity("A", 1, 0, 1)])
+
+    resumable_bottom_up(event, 0.0, path)
+    assert path.exists()
+
+    with pytest.raises(ValueError):
+        resumable_bottom_up(other, 0.0, path)
+    with pytest.raises(ValueError):
+        resumable_bruteforce(event, 0.0, path)
+
+
+def test_resume_rejects_checkpoint_saved_under_other_constraints(tmp_path):
+    path = tmp_path / "solve.ckpt"
+    event = load_event_file("input_large.txt")
+
+    resumable_bruteforce(event, 0.0, path, interval=0.0)
+    assert path.exists()
+
+    event.constraints = Constraints(excluded={event.activities[0].name})
+    with pytest.raises(ValueError, match="does not match"):
+        resumable_bruteforce(event, 0.0, path)
+
+
+def test_fingerprint_ignores_the_order_of_constraints():
+    activities = [Activity(name, 1, 0, 1) for name in "ABC"]
+    first = Event(3, 0, activities, constraints=Constraints(
+        conflicts=[("A", "B"), ("B", "C")], groups=[({"A", "C"}, 1)]
+    ))
+    second = Event(3, 0, activities, constraints=Constraints(
+        conflicts=[("C", "B"), ("B", "A")], groups=[({"C", "A"}, 1)]
+    ))
+    third = Event(3, 0, activities, constraints=Constraints(
+        conflicts=[("A", "B"), ("B", "C")], groups=[({"A", "C"}, 2)]
+    ))
+
+    assert event_fingerprint(first, "bruteforce") == \
+        event_fingerprint(second, "bruteforce")
+    assert event_fingerprint(first, "bruteforce") != \
+        event_fingerprint(third, "bruteforce")
@@ -0,0 +1,264 @@
+import random
+import time
+
+import pytest
+
+from student_society_event_planner.algorithms import (
+    bottom_up,
+    bruteforce,
+    constrained_bottom_up,
+    fptas,
+    greedy,
+    hirschberg,
+    multi_window,
+    out_of_core_bottom_up,
+    resumable_bottom_up,
+    resumable_bruteforce,
+    sparse_dp,
+)
+from student_society_event_planner.classes import Activity, Constraints, Event
+from student_society_event_planner.utils import load_event_file
+import student_society_event_planner.algorithms as algorithms
+
+from .helpers import _names, _satisfies
+
+
+def _reference_constrained(event):
+    """Best enjoyment over every subset that satisfies the constraints."""
+    best = None
+    n = len(event.activities)
+    for mask in range(1 << n):
+        chosen = [event.activities[i] for i in range(n) if mask >> i & 1]
+        if sum(a.time for a in chosen) > event.max_time:
+            continue
+        if not _satisfies(chosen, event.constraints):
+            continue
+        enjoyment = sum(a.enjoyment for a in chosen)
+        time_used = sum(a.time for a in chosen)
+        if best is None or (enjoyment, -time_used) > (best[0], -best[1]):
+            best = (enjoyment, time_used)
+    return best
+
+
+def test_constraints_are_falsy_when_empty():
+    assert not Constraints()
+    assert Constraints(excluded={"A"})
+
+
+def test_bottom_up_respects_mandatory_excluded_and_conflicts():
+    """Pub-Quiz and Karaoke conflict, and the walk must be included."""
+    event = Event(
+        max_time=10,
+        max_budget=0,
+        activities=[
+            Activity("Orientation-Walk", 3, 0, 10),
+            Activity("Pub-Quiz", 3, 0, 90),
+            Activity("Karaoke", 3, 0, 80),
+            Activity("Museum-Trip", 4, 0, 100),
+            Activity("Zoo-Trip", 2, 0, 5),
+        ],
+        constraints=Constraints(
+            mandatory={"Orientation-Walk"},
+            excluded={"Zoo-Trip"},
+            conflicts=[("Pub-Quiz", "Karaoke")],
+        ),
+    )
+
+    chosen, enjoyment, time_used = bottom_up(event, time_limit=10.0)
+
+    assert _names(chosen) == ["Museum-Trip", "Orientation-Walk", "Pub-Quiz"]
+    assert enjoyment == 200
+    assert time_used == 10
+
+
+def test_group_limit_caps_the_number_of_trips():
+    event = Event(
+        max_time=100,
+        max_budget=0,
+        activities=[Activity(f"Trip-{i}", 1, 0, 10 + i) for i in range(6)]
+        + [Activity("Games", 1, 0, 1)],
+        constraints=Constraints(groups=[({f"Trip-{i}" for i in range(6)}, 2)]),
+    )
+
+    chosen, enjoyment, _ = bottom_up(event, time_limit=10.0)
+
+    assert _names(chosen) == ["Games", "Trip-4", "Trip-5"]
+    assert enjoyment == 30
+
+
+def test_constrained_bottom_up_matches_reference_on_random_instances():
+    rng = random.Random(123)
+
+    for trial in range(150):
+        n = rng.randint(1, 10)
+        activities = [
+            Activity(f"A{i}", rng.randint(0, 6), 0, rng.randint(0, 100))
+            for i in range(n)
+        ]
+        names = [a.name for a in activities]
+        mandatory = set(rng.sample(names, rng.randint(0, min(2, n))))
+        excluded = set(rng.sample(names, rng.randint(0, min(2, n)))) - mandatory
+        conflicts = [
+            tuple(rng.sample(names, 2)) for _ in range(rng.randint(0, 3))
+        ] if n >= 2 else []
+        groups = [
+            (set(rng.sample(names, rng.randint(1, n))), rng.randint(0, 3))
+            for _ in range(rng.randint(0, 2))
+        ]
+        event = Event(
+            max_time=rng.randint(0, 25),
+            max_budget=0,
+            activities=activities,
+            constraints=Constraints(mandatory, excluded, conflicts, groups),
+        )
+
+        expected = _reference_constrained(event)
+        if expected is None:
+            with pytest.raises(ValueError):
+                constrained_bottom_up(event, time_limit=10.0)
+            continue
+
+        # Forced choices that are feasible together must always succeed
+        chosen, enjoyment, time_used = constrained_bottom_up(event, time_limit=10.0)
+
+        assert (enjoyment, time_used) == expected, f"Trial {trial}"
+        assert enjoyment == sum(a.enjoyment for a in chosen), f"Trial {trial}"
+        assert time_used == sum(a.time for a in chosen), f"Trial {trial}"
+        assert _satisfies(chosen, event.constraints), f"Trial {trial}"
+
+
+@pytest.mark.parametrize(
+    "constraints",
+    [
+        Constraints(mandatory={"Missing"}),
+        Constraints(mandatory={"A"}, excluded={"A"}),
+        Constraints(mandatory={"A", "B"}, conflicts=[("A", "B")]),
+        Constraints(mandatory={"A", "B"}, groups=[({"A", "B"}, 1)]),
+        Constraints(mandatory={"A", "B", "C"}),
+    ],
+)
+def test_infeasible_constraints_raise(constraints):
+    event = Event(
+        max_time=5,
+        max_budget=0,
+        activities=[
+            Activity("A", 2, 0, 10),
+            Activity("B", 2, 0, 20),
+            Activity("C", 2, 0, 30),
+        ],
+        constraints=constraints,
+    )
+
+    with pytest.raises(ValueError):
+        bottom_up(event, time_limit=10.0)
+
+
+def test_constrained_solve_costs_about_the_same_on_input_1000():
+    """Pairwise conflicts only add small choice groups to the DP."""
+    event = load_event_file("input_1000.txt")
+    names = [a.name for a in event.activities]
+    event.constraints = Constraints(
+        mandatory={names[0]},
+        conflicts=[(names[i], names[i + 1]) for i in range(1, 200, 2)],
+        groups=[(set(names[300:310]), 2)],
+    )
+
+    chosen, enjoyment, time_used = bottom_up(event, time_limit=10.0)
+
+    assert _satisfies(chosen, event.constraints)
+    assert time_used <= event.max_time
+    assert enjoyment == sum(a.enjoyment for a in chosen)
+
+
+@pytest.mark.parametrize(
+    "links",
+    [
+        lambda names: Constraints(
+            conflicts=[(names[i], names[i + 1]) for i in range(30)]
+        ),
+        lambda names: Constraints(groups=[(set(names[:40]), 6)]),
+        lambda names: Constraints(groups=[(set(names), 20)]),
+        lambda names: Constraints(
+            conflicts=[(names[i], names[i + 1]) for i in range(999)]
+        ),
+    ],
+)
+def test_long_links_stay_fast_on_input_1000(links):
+    """Conflict chains and group limits add DP states, not enumerated subsets."""
+    event = load_event_file("input_1000.txt")
+    event.constraints = links([a.name for a in event.activities])
+
+    start = time.perf_counter()
+    chosen, enjoyment, time_used = bottom_up(event, time_limit=10.0)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 5.0
+    assert _satisfies(chosen, event.constraints)
+    assert time_used <= event.max_time
+    assert enjoyment == sum(a.enjoyment for a in chosen)
+
+
+def test_too_many_linked_states_raise(monkeypatch):
+    monkeypatch.setattr(algorithms, "MAX_CONSTRAINT_STATES", 2)
+    event = Event(
+        max_time=10,
+        max_budget=0,
+        activities=[Activity(f"A{i}", 1, 0, 10) for i in range(6)],
+        constraints=Constraints(groups=[({f"A{i}" for i in range(6)}, 4)]),
+    )
+
+    with pytest.raises(ValueError):
+        bottom_up(event, time_limit=10.0)
+
+
+def test_mandatory_activity_keeps_its_other_repeats():
+    event = Event(
+        max_time=10,
+        max_budget=0,
+        activities=[
+            Activity("Workshop", 2, 0, 30, repeats=3),
+            Activity("Games", 4, 0, 10),
+        ],
+        constraints=Constraints(mandatory={"Workshop"}),
+    )
+
+    chosen, enjoyment, time_used = bottom_up(event, time_limit=10.0)
+
+    assert _names(chosen) == ["Games", "Workshop", "Workshop", "Workshop"]
+    assert enjoyment == 100
+    assert time_used == 10
+
+
+def _conflicting_event():
+    return Event(
+        max_time=5,
+        max_budget=0,
+        activities=[Activity("A", 2, 0, 10), Activity("B", 2, 0, 20)],
+        constraints=Constraints(conflicts=[("A", "B")]),
+    )
+
+
+@pytest.mark.parametrize("solver", [bruteforce, resumable_bruteforce])
+def test_search_solvers_enforce_constraints(solver):
+    chosen, enjoyment, time_used = solver(_conflicting_event(), time_limit=10.0)
+
+    assert _names(chosen) == ["B"]
+    assert enjoyment == 20
+    assert time_used == 2
+
+
+@pytest.mark.parametrize(
+    "solver",
+    [
+        hirschberg,
+        sparse_dp,
+        greedy,
+        fptas,
+        multi_window,
+        resumable_bottom_up,
+        out_of_core_bottom_up,
+    ],
+)
+def test_other_solvers_reject_constraints(solver):
+    with pytest.raises(ValueError):
+        solver(_conflicting_event(), time_limit=10.0)
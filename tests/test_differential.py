@@ -0,0 +1,124 @@
+from collections import Counter
+import random
+
+import pytest
+
+from student_society_event_planner.algorithms import (
+    bottom_up,
+    bruteforce,
+    constrained_bottom_up,
+    fptas,
+    greedy,
+    hirschberg,
+    out_of_core_bottom_up,
+    resumable_bottom_up,
+    resumable_bruteforce,
+    sparse_dp,
+)
+
+from .helpers import EVENT_KINDS, _random_event, _reference_exhaustive, _satisfies
+
+# Engines that must return the optimal enjoyment
+EXACT_SOLVERS = [
+    bruteforce,
+    resumable_bruteforce,
+    bottom_up,
+    resumable_bottom_up,
+    out_of_core_bottom_up,
+    constrained_bottom_up,
+    hirschberg,
+    sparse_dp,
+]
+
+# Engines that also break ties by the smallest time used
+MIN_TIME_SOLVERS = [
+    bottom_up,
+    resumable_bottom_up,
+    out_of_core_bottom_up,
+    constrained_bottom_up,
+    hirschberg,
+    sparse_dp,
+]
+
+# Engines that return a guaranteed fraction of the optimum as a fourth value
+APPROXIMATE_SOLVERS = [greedy, fptas]
+
+# Engines that keep to the event's constraints, the rest must reject them
+CONSTRAINED_SOLVERS = [
+    bruteforce,
+    resumable_bruteforce,
+    bottom_up,
+    constrained_bottom_up,
+]
+
+
+def _check_feasible(event, solver, result, context):
+    chosen, enjoyment, time_used = result[:3]
+    name = solver.__name__
+
+    assert time_used <= event.max_time, \
+        f"{context} {name}: Time constraint violated: {time_used} > {event.max_time}"
+    assert time_used == sum(a.time for a in chosen), \
+        f"{context} {name}: Time used mismatch"
+    assert enjoyment == sum(a.enjoyment for a in chosen), \
+        f"{context} {name}: Enjoyment mismatch"
+    assert all(
+        count <= a.repeats for a, count in Counter(chosen).items()
+    ), f"{context} {name}: Activity chosen more often than it repeats"
+    assert _satisfies(chosen, event.constraints), \
+        f"{context} {name}: Constraints violated"
+    assert all(any(a is b for b in event.activities) for a in chosen), \
+        f"{context} {name}: Unknown activity in solution"
+
+
+def _run_differential(seed, trials, max_n):
+    rng = random.Random(seed)
+
+    for trial in range(trials):
+        kind = EVENT_KINDS[trial % len(EVENT_KINDS)]
+        event = _random_event(rng, kind, max_n)
+        context = f"Seed {seed} trial {trial} ({kind}):"
+
+        _, ref_enjoyment, ref_time = _reference_exhaustive(event)
+
+        for solver in EXACT_SOLVERS + APPROXIMATE_SOLVERS:
+            if event.constraints and solver not in CONSTRAINED_SOLVERS:
+                with pytest.raises(ValueError):
+                    solver(event, time_limit=10.0)
+
+        for solver in EXACT_SOLVERS:
+            if event.constraints and solver not in CONSTRAINED_SOLVERS:
+                continue
+            result = solver(event, time_limit=10.0)
+            _check_feasible(event, solver, result, context)
+
+            assert result[1] == ref_enjoyment, \
+                f"{context} {solver.__name__}: Expected enjoyment " \
+                f"{ref_enjoyment}, got {result[1]}"
+            if solver in MIN_TIME_SOLVERS:
+                assert result[2] == ref_time, \
+                    f"{context} {solver.__name__}: Expected time " \
+                    f"{ref_time}, got {result[2]}"
+
+        for solver in APPROXIMATE_SOLVERS:
+            if event.constraints:
+                continue
+            result = solver(event, time_limit=10.0)
+            _check_feasible(event, solver, result, context)
+
+            assert result[1] >= result[3] * ref_enjoyment, \
+                f"{context} {solver.__name__}: {result[1]} below " \
+                f"{result[3]} * {ref_enjoyment}"
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_all_solvers_agree_on_random_events(seed):
+    """Quick tier: every engine agrees with the exhaustive reference."""
+    _run_differential(seed, trials=300, max_n=9)
+
+
+@pytest.mark.soak
+@pytest.mark.parametrize("seed", range(100, 120))
+def test_all_solvers_agree_on_random_events_soak(seed):
+    """Long tier, run with `pytest -m soak`."""
+    _run_differential(seed, trials=1000, max_n=13)
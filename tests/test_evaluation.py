@@ -0,0 +1,118 @@
+import random
+import time
+
+import numpy as np
+import pytest
+
+from student_society_event_planner.algorithms import bottom_up
+from student_society_event_planner.classes import Activity, Event
+from student_society_event_planner.evaluation import evaluate_plans, pack_plans
+from student_society_event_planner.utils import load_event_file
+
+
+def _random_plans(event, count, seed):
+    rng = random.Random(seed)
+    return [
+        [a for a in event.activities if rng.random() < 0.05] for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("fname", ["input_small.txt", "input_1000.txt"])
+def test_evaluate_plans_matches_python_sums(fname):
+    event = load_event_file(fname)
+    plans = _random_plans(event, 500, seed=9)
+    plans.append(bottom_up(event, time_limit=10.0)[0])
+    plans.append([])
+
+    feasible, times, costs, enjoyments = evaluate_plans(event, pack_plans(event, plans))
+
+    for row, plan in enumerate(plans):
+        time_used = sum(a.time for a in plan)
+        assert times[row] == time_used
+        assert costs[row] == sum(a.cost for a in plan)
+        assert enjoyments[row] == sum(a.enjoyment for a in plan)
+        assert feasible[row] == (time_used <= event.max_time)
+
+
+def test_pack_plans_bit_layout():
+    activities = [Activity(f"A{i}", 1, 0, 1) for i in range(10)]
+    event = Event(max_time=5, max_budget=0, activities=activities)
+
+    packed = pack_plans(event, [[activities[0], activities[9]], []])
+
+    assert packed.shape == (2, 2)
+    assert packed.dtype == np.uint8
+    assert packed.tolist() == [[0b00000001, 0b00000010], [0, 0]]
+
+
+def test_pack_plans_rejects_unknown_or_repeated_activities():
+    event = load_event_file("input_small.txt")
+
+    with pytest.raises(ValueError):
+        pack_plans(event, [[Activity("Other", 1, 1, 1)]])
+    with pytest.raises(ValueError):
+        pack_plans(event, [[event.activities[0], event.activities[0]]])
+
+
+def test_evaluate_plans_counts_repeated_activities():
+    """Counts of repeatable activities are packed in binary, low bit first."""
+    activities = [
+        Activity("Workshop", 2, 5, 30, repeats=5),
+        Activity("Quiz", 3, 1, 40),
+    ]
+    event = Event(max_time=12, max_budget=0, activities=activities)
+    plan = bottom_up(event, time_limit=10.0)[0]
+
+    packed = pack_plans(event, [plan, [activities[0]] * 3, []])
+
+    # Three columns for up to five workshops, then one for the quiz
+    assert packed.shape == (3, 1)
+    assert packed[1].tolist() == [0b0011]
+
+    feasible, times, costs, enjoyments = evaluate_plans(event, packed)
+
+    assert enjoyments.tolist() == [sum(a.enjoyment for a in plan), 90, 0]
+    assert times.tolist() == [sum(a.time for a in plan), 6, 0]
+    assert costs.tolist() == [sum(a.cost for a in plan), 15, 0]
+    assert feasible.tolist() == [True, True, True]
+
+    with pytest.raises(ValueError):
+        pack_plans(event, [[activities[0]] * 6])
+
+    # Seven workshops fit in the columns but are more than the repeats allow
+    feasible, _, _, _ = evaluate_plans(event, np.array([[0b0111]], dtype=np.uint8))
+    assert feasible.tolist() == [False]
+
+
+def test_evaluate_plans_rejects_mismatched_matrix():
+    event = load_event_file("input_small.txt")
+
+    with pytest.raises(ValueError):
+        evaluate_plans(event, np.zeros((3, 5), dtype=np.uint8))
+
+
+def test_evaluate_plans_handles_huge_values_exactly():
+    """Totals beyond 53 bits fall back to exact integer arithmetic."""
+    activities = [Activity(f"A{i}", 2**60, 0, 2**61 + i) for i in range(3)]
+    event = Event(max_time=2**62, max_budget=0, activities=activities)
+
+    _, times, _, enjoyments = evaluate_plans(
+        event, pack_plans(event, [activities[:2], [activities[2]]])
+    )
+
+    assert times.tolist() == [2**61, 2**60]
+    assert enjoyments.tolist() == [2**62 + 1, 2**61 + 2]
+
+
+def test_evaluate_many_random_bitmasks_quickly():
+    event = load_event_file("input_1000.txt")
+    rng = np.random.default_rng(0)
+    packed = rng.integers(0, 256, size=(20000, 125), dtype=np.uint8)
+
+    start = time.perf_counter()
+    feasible, times, _, _ = evaluate_plans(event, packed)
+    elapsed = time.perf_counter() - start
+
+    assert feasible.shape == (20000,)
+    assert times.dtype == np.int64
+    assert elapsed < 10.0
@@ -0,0 +1,132 @@
+import time
+import tracemalloc
+
+import pytest
+
+from student_society_event_planner.algorithms import bottom_up, hirschberg, sparse_dp
+from student_society_event_planner.generator import (
+    KINDS,
+    generate_event,
+    write_event_binary,
+    write_event_file,
+)
+from student_society_event_planner.utils import load_event_file
+
+
+def _as_tuples(event):
+    return [(a.name, a.time, a.cost, a.enjoyment, a.repeats) for a in event.activities]
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_generate_event_is_deterministic_by_seed(kind):
+    first = generate_event(200, kind, seed=3)
+    second = generate_event(200, kind, seed=3)
+    other = generate_event(200, kind, seed=4)
+
+    assert _as_tuples(first) == _as_tuples(second)
+    assert (first.max_time, first.max_budget) == (second.max_time, second.max_budget)
+    assert _as_tuples(first) != _as_tuples(other)
+
+
+def test_generate_event_distributions():
+    strongly = generate_event(500, "strongly_correlated", seed=1, value_range=100)
+    subset_sum = generate_event(500, "subset_sum", seed=1, value_range=100)
+
+    assert all(a.enjoyment == a.time + 10 for a in strongly.activities)
+    assert all(a.enjoyment == a.time for a in subset_sum.activities)
+
+
+def test_generate_event_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        generate_event(10, "not-a-kind")
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_generated_files_round_trip(tmp_path, monkeypatch, kind):
+    """Both the text and binary files should load back to the same event."""
+    (tmp_path / "input_files").mkdir()
+    monkeypatch.chdir(tmp_path)
+    event = generate_event(300, kind, seed=11, max_time=1_000_000, max_repeats=3)
+
+    write_event_file(event, tmp_path / "input_files" / "generated.txt")
+    write_event_binary(event, tmp_path / "input_files" / "generated.bin")
+
+    for fname in ("generated.txt", "generated.bin"):
+        loaded = load_event_file(fname)
+
+        assert loaded.max_time == 1_000_000
+        assert loaded.max_budget == event.max_budget
+        assert _as_tuples(loaded) == _as_tuples(event)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"NOPE" + bytes(25),
+    ],
+)
+def test_invalid_binary_file_errors(tmp_path, monkeypatch, content):
+    (tmp_path / "input_files").mkdir()
+    (tmp_path / "input_files" / "temp.bin").write_bytes(content)
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(ValueError):
+        load_event_file("temp.bin")
+
+
+# Largest n * max_time table bottom_up is run on, about 240 MB of row pointers
+BOTTOM_UP_MAX_CELLS = 30_000_000
+
+
+def _record_scaling(record_property, sizes, kind):
+    """Time and trace the memory of each solver over increasing sizes."""
+    curves = {solver.__name__: [] for solver in (bottom_up, hirschberg, sparse_dp)}
+
+    for activity_count, value_range in sizes:
+        event = generate_event(activity_count, kind, seed=0, value_range=value_range)
+
+        solvers = [hirschberg, sparse_dp]
+        if activity_count * (event.max_time + 1) <= BOTTOM_UP_MAX_CELLS:
+            solvers.insert(0, bottom_up)
+
+        enjoyments = set()
+        for solver in solvers:
+            # Tracing slows solvers down unevenly, so time an untraced run
+            start = time.perf_counter()
+            _, enjoyment, _ = solver(event, time_limit=600)
+            elapsed = time.perf_counter() - start
+
+            tracemalloc.start()
+            solver(event, time_limit=600)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            enjoyments.add(enjoyment)
+            curves[solver.__name__].append(
+                (activity_count, event.max_time, round(elapsed, 5), peak)
+            )
+
+        assert len(enjoyments) == 1, \
+            f"Solvers disagree at n={activity_count}: {enjoyments}"
+
+    # Each curve is a list of (n, max_time, seconds, peak bytes)
+    for name, curve in curves.items():
+        record_property(f"scaling_{kind}_{name}", curve)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_solver_scaling_curves(record_property, kind):
+    """Quick tier: small sizes, just checks the recording and agreement."""
+    _record_scaling(record_property, [(25, 20), (50, 20), (100, 20)], kind)
+
+
+@pytest.mark.soak
+@pytest.mark.parametrize("kind", KINDS)
+def test_solver_scaling_curves_soak(record_property, kind):
+    """Long tier, run with `pytest -m soak --junitxml=scaling.xml`."""
+    _record_scaling(
+        record_property,
+        [(250, 50), (500, 100), (1000, 100), (2000, 200)],
+        kind
+    )
@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from student_society_event_planner.algorithms import bottom_up, hirschberg
+from student_society_event_planner.classes import Activity, Event
+from student_society_event_planner.utils import load_event_file
+
+from .helpers import _names, _reference_exhaustive
+
+
+def test_hirschberg_finds_known_optimum_for_sample_small_time_constraint():
+    """input_small.txt has a unique best set when using time as the constraint."""
+    event = load_event_file("input_small.txt")
+
+    chosen, enjoyment, time_used = hirschberg(event, time_limit=10.0)
+
+    assert enjoyment == 370, f"Expected enjoyment 370, got {enjoyment}"
+    assert time_used == 9, f"Expected time_used 9, got {time_used}"
+    assert _names(chosen) == ["Game-Night", "Museum-Trip", "Pizza-Workshop"], \
+        f"Expected specific activities, got {_names(chosen)}"
+
+
+@pytest.mark.parametrize(
+    "fname",
+    [
+        "input_medium.txt",
+        "input_large.txt",
+        "input_100.txt",
+        "input_1000.txt",
+    ],
+)
+def test_hirschberg_matches_bottom_up_on_provided_inputs(fname):
+    """Linear-space reconstruction should match the full DP table."""
+    event = load_event_file(fname)
+
+    dp_chosen, dp_enjoyment, dp_time = bottom_up(event, time_limit=10.0)
+    chosen, enjoyment, time_used = hirschberg(event, time_limit=10.0)
+
+    assert enjoyment == dp_enjoyment, \
+        f"Enjoyment mismatch: DP={dp_enjoyment}, Hirschberg={enjoyment}"
+    assert time_used == dp_time, \
+        f"Time used mismatch: DP={dp_time}, Hirschberg={time_used}"
+    assert enjoyment == sum(a.enjoyment for a in chosen), \
+        "Reported enjoyment does not match chosen activities"
+    assert time_used == sum(a.time for a in chosen), \
+        "Reported time does not match chosen activities"
+    assert len(chosen) == len(set(id(a) for a in chosen)), \
+        "Duplicate activities in solution"
+
+
+def test_hirschberg_matches_reference_exhaustive_on_random_small_instances():
+    """Hirschberg reconstruction should hit the true optimum for small n."""
+    rng = random.Random(2024)
+
+    for trial in range(50):
+        n = rng.randint(1, 12)
+        max_time = rng.randint(0, 15)
+        activities = [
+            Activity(
+                name=f"A{i}",
+                time=rng.randint(0, 6),
+                cost=rng.randint(0, 200),
+                enjoyment=rng.randint(0, 250),
+            )
+            for i in range(n)
+        ]
+        event = Event(max_time=max_time, max_budget=0, activities=activities)
+
+        _, ref_enjoyment, ref_time = _reference_exhaustive(event)
+        chosen, enjoyment, time_used = hirschberg(event, time_limit=10.0)
+
+        assert enjoyment == ref_enjoyment, \
+            f"Trial {trial}: Expected enjoyment {ref_enjoyment}, got {enjoyment}"
+        assert time_used == ref_time, \
+            f"Trial {trial}: Expected time {ref_time}, got {time_used}"
+        assert enjoyment == sum(a.enjoyment for a in chosen), \
+            f"Trial {trial}: Enjoyment mismatch"
+        assert time_used == sum(a.time for a in chosen), \
+            f"Trial {trial}: Time used mismatch"
+
+
+def test_hirschberg_empty_and_zero_capacity():
+    """No activities or no time should both return an empty plan."""
+    empty = Event(max_time=10, max_budget=0, activities=[])
+    assert hirschberg(empty, time_limit=10.0) == ([], 0, 0)
+
+    event = Event(
+        max_time=0,
+        max_budget=0,
+        activities=[Activity("A", 2, 10, 50), Activity("B", 3, 20, 80)],
+    )
+    assert hirschberg(event, time_limit=10.0) == ([], 0, 0)
+
+
+def test_hirschberg_large_capacity():
+    """Large capacities only need linear memory for the reconstruction."""
+    rng = random.Random(7)
+    activities = [
+        Activity(f"A{i}", rng.randint(1000, 50000), 0, rng.randint(1, 1000))
+        for i in range(16)
+    ]
+    event = Event(max_time=100000, max_budget=0, activities=activities)
+
+    chosen, enjoyment, time_used = hirschberg(event, time_limit=10.0)
+
+    assert time_used <= event.max_time
+    assert enjoyment == sum(a.enjoyment for a in chosen)
+    assert time_used == sum(a.time for a in chosen)
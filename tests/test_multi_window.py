@@ -0,0 +1,168 @@
+from collections import Counter
+import itertools
+import random
+import time
+
+import pytest
+
+from student_society_event_planner.algorithms import bottom_up, multi_window
+from student_society_event_planner.classes import Activity, Event
+from student_society_event_planner.utils import load_event_file
+
+
+def _reference_multi_window(event: Event) -> int:
+    """Best total enjoyment over every assignment of activity copies to windows."""
+    capacities = [max_time for max_time, _ in event.windows]
+    activities = [a for a in event.activities for _ in range(a.repeats)]
+    best = 0
+
+    for assignment in itertools.product(
+        range(-1, len(capacities)), repeat=len(activities)
+    ):
+        used = [0] * len(capacities)
+        enjoyment = 0
+        for activity, k in zip(activities, assignment):
+            if k >= 0:
+                used[k] += activity.time
+                enjoyment += activity.enjoyment
+        if all(u <= c for u, c in zip(used, capacities)):
+            best = max(best, enjoyment)
+
+    return best
+
+
+def _check_plan(event, plan, enjoyment, time_used):
+    assert len(plan) == len(event.windows), "Expected one plan per window"
+    for window, (max_time, _) in zip(plan, event.windows):
+        assert sum(a.time for a in window) <= max_time, "Window capacity exceeded"
+
+    chosen = [a for window in plan for a in window]
+    assert all(count <= a.repeats for a, count in Counter(chosen).items()), \
+        "Activity assigned more often than it repeats"
+    assert enjoyment == sum(a.enjoyment for a in chosen), "Enjoyment mismatch"
+    assert time_used == sum(a.time for a in chosen), "Time used mismatch"
+
+
+def test_multi_window_single_window_matches_bottom_up():
+    """An event without explicit windows has a single window."""
+    event = load_event_file("input_medium.txt")
+
+    plan, enjoyment, time_used, proven = multi_window(event, time_limit=10.0)
+    _, dp_enjoyment, _ = bottom_up(event, time_limit=10.0)
+
+    assert len(plan) == 1
+    assert enjoyment == dp_enjoyment
+    _check_plan(event, plan, enjoyment, time_used)
+
+
+def test_multi_window_beats_sequential_days():
+    """Solving day by day greedily can be suboptimal."""
+    event = Event(
+        max_time=6,
+        max_budget=0,
+        activities=[
+            Activity("A", 4, 0, 40),
+            Activity("B", 3, 0, 33),
+            Activity("C", 3, 0, 33),
+            Activity("D", 2, 0, 20),
+            Activity("E", 2, 0, 20),
+        ],
+        windows=[(6, 0), (6, 0)],
+    )
+
+    plan, enjoyment, time_used, proven = multi_window(event, time_limit=10.0)
+
+    # A+D in one day and B+C in the other uses all 12 hours
+    assert enjoyment == 126, f"Expected enjoyment 126, got {enjoyment}"
+    _check_plan(event, plan, enjoyment, time_used)
+
+
+def test_multi_window_matches_reference_on_random_small_instances():
+    rng = random.Random(8)
+
+    for trial in range(60):
+        n = rng.randint(1, 7)
+        windows = [(rng.randint(0, 10), 0) for _ in range(rng.randint(1, 3))]
+        activities = [
+            Activity(f"A{i}", rng.randint(0, 6), 0, rng.randint(0, 100))
+            for i in range(n)
+        ]
+        event = Event(windows[0][0], 0, activities, windows=windows)
+
+        plan, enjoyment, time_used, proven = multi_window(event, time_limit=10.0)
+
+        assert enjoyment == _reference_multi_window(event), f"Trial {trial}"
+        assert proven, f"Trial {trial}"
+        _check_plan(event, plan, enjoyment, time_used)
+
+
+def test_multi_window_assigns_each_repeat_once():
+    """Each copy of a repeated activity counts once, in one window."""
+    event = Event(
+        max_time=6,
+        max_budget=0,
+        activities=[
+            Activity("W", 2, 0, 10, repeats=3),
+            Activity("X", 5, 0, 1),
+        ],
+        windows=[(6, 0), (6, 0)],
+    )
+
+    plan, enjoyment, time_used, proven = multi_window(event, time_limit=10.0)
+
+    assert enjoyment == 31, f"Expected enjoyment 31, got {enjoyment}"
+    _check_plan(event, plan, enjoyment, time_used)
+
+
+def test_multi_window_matches_reference_with_repeats():
+    rng = random.Random(36)
+
+    for trial in range(40):
+        windows = [(rng.randint(0, 10), 0) for _ in range(rng.randint(1, 3))]
+        activities = [
+            Activity(f"A{i}", rng.randint(0, 6), 0, rng.randint(0, 100),
+                     rng.randint(1, 3))
+            for i in range(rng.randint(1, 3))
+        ]
+        event = Event(windows[0][0], 0, activities, windows=windows)
+
+        plan, enjoyment, time_used, proven = multi_window(event, time_limit=10.0)
+
+        assert enjoyment == _reference_multi_window(event), f"Trial {trial}"
+        assert proven, f"Trial {trial}"
+        _check_plan(event, plan, enjoyment, time_used)
+
+
+@pytest.mark.parametrize(
+    ("days", "max_time", "expected"),
+    [(7, 138, 61183), (5, 41, 20231), (3, 97, 25989)],
+)
+def test_multi_window_week_long_plan_on_input_1000(days, max_time, expected):
+    """Week-long plans over 1000 activities should be proven optimal in seconds."""
+    event = load_event_file("input_1000.txt")
+    event.windows = [(max_time, event.max_budget)] * days
+
+    start = time.perf_counter()
+    plan, enjoyment, time_used, proven = multi_window(event, time_limit=600.0)
+    elapsed = time.perf_counter() - start
+
+    assert proven, "Expected the search to finish"
+    assert elapsed < 5.0
+    assert enjoyment == expected
+    _check_plan(event, plan, enjoyment, time_used)
+    assert time_used <= days * max_time
+
+
+def test_multi_window_reports_a_timed_out_search():
+    """A search cut short by the time limit is not reported as optimal."""
+    rng = random.Random(1)
+    activities = [Activity(f"A{i}", 2, 0, rng.randint(50, 60)) for i in range(20)]
+    event = Event(3, 0, activities, windows=[(3, 0)] * 6)
+
+    plan, enjoyment, time_used, proven = multi_window(event, time_limit=0.0)
+    assert not proven
+    _check_plan(event, plan, enjoyment, time_used)
+
+    _, best, _, proven = multi_window(event, time_limit=60.0)
+    assert proven
+    assert best >= enjoyment
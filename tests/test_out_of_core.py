@@ -0,0 +1,65 @@
+import random
+import tracemalloc
+
+import pytest
+
+from student_society_event_planner.algorithms import bottom_up, out_of_core_bottom_up
+from student_society_event_planner.classes import Activity, Event
+from student_society_event_planner.utils import load_event_file
+
+from .helpers import EVENT_KINDS, _random_event
+
+
+@pytest.mark.parametrize("block_bytes", [1, 7, 1 << 20])
+def test_out_of_core_matches_bottom_up_on_random_events(block_bytes):
+    """Results must be identical to the in-memory solver for any block size."""
+    rng = random.Random(55)
+    kinds = [kind for kind in EVENT_KINDS if kind != "constraints"]
+
+    for trial in range(150):
+        event = _random_event(rng, kinds[trial % len(kinds)])
+
+        expected = bottom_up(event, time_limit=10.0)
+        result = out_of_core_bottom_up(event, 10.0, block_bytes=block_bytes)
+
+        assert result == expected, f"Trial {trial}"
+
+
+@pytest.mark.parametrize("fname", ["input_100.txt", "input_1000.txt"])
+def test_out_of_core_matches_bottom_up_on_provided_inputs(tmp_path, fname):
+    event = load_event_file(fname)
+    path = tmp_path / "decisions.bin"
+
+    result = out_of_core_bottom_up(event, 10.0, path, block_bytes=256)
+
+    assert result == bottom_up(event, time_limit=10.0)
+    # One row of decision bits per activity is kept on disk
+    assert path.stat().st_size == len(event.activities) * (event.max_time // 8 + 1)
+
+
+def test_out_of_core_peak_memory_is_independent_of_activity_count():
+    """Growing n tenfold should not grow the traced peak memory much."""
+    rng = random.Random(3)
+    peaks = []
+
+    for activities_count in (100, 1000):
+        activities = [
+            Activity(f"A{i}", rng.randint(1, 50), 0, rng.randint(1, 100))
+            for i in range(activities_count)
+        ]
+        event = Event(max_time=300, max_budget=0, activities=activities)
+
+        tracemalloc.start()
+        out_of_core_bottom_up(event, 10.0, block_bytes=4096)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+
+    # The activity list itself is the only part that grows with n
+    assert peaks[1] < peaks[0] + 1000 * 1000, f"Peak memory grew: {peaks}"
+
+
+def test_out_of_core_empty_event():
+    event = Event(max_time=10, max_budget=0, activities=[])
+
+    assert out_of_core_bottom_up(event, 10.0) == ([], 0, 0)
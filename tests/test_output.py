@@ -0,0 +1,129 @@
+import csv
+import io
+import json
+
+import pytest
+
+from student_society_event_planner.algorithms import bottom_up
+from student_society_event_planner.output import (
+    WRITERS,
+    CsvWriter,
+    JsonLinesWriter,
+    Report,
+    TextWriter,
+)
+from student_society_event_planner.utils import load_event_file
+
+
+@pytest.fixture
+def event_and_report():
+    event = load_event_file("input_small.txt")
+    chosen, enjoyment, time_used = bottom_up(event, time_limit=10.0)
+    report = Report("bottom_up", "BOTTOM UP", chosen, enjoyment, time_used, 0.25)
+    return event, report, chosen
+
+
+def test_text_writer_matches_activity_str(event_and_report):
+    """Bulk formatting must match Activity.__str__ line for line."""
+    event, report, chosen = event_and_report
+    stream = io.StringIO()
+
+    writer = TextWriter(stream)
+    writer.write_header("input_small.txt", event)
+    writer.write_report(report)
+    output = stream.getvalue()
+
+    assert "Input File: input_small.txt\n" in output
+    assert "--- BOTTOM UP ALGORITHM ---\nSelected Activities:\n" in output
+    assert "\n".join(f"- {str(a)}" for a in chosen) in output
+    assert "Total Enjoyment: 370\nTotal Time Used: 9 hours\n\n" in output
+    assert "Execution Time: 0.25000 seconds\n" in output
+
+
+def test_text_writer_quiet_skips_activities(event_and_report):
+    event, report, chosen = event_and_report
+    stream = io.StringIO()
+
+    TextWriter(stream, quiet=True).write_report(report)
+    output = stream.getvalue()
+
+    assert "Selected Activities" not in output
+    assert all(a.name not in output for a in chosen)
+    assert "Total Enjoyment: 370\n" in output
+
+
+@pytest.mark.parametrize("quiet", [False, True])
+def test_json_lines_writer(event_and_report, quiet):
+    event, report, chosen = event_and_report
+    stream = io.StringIO()
+
+    writer = JsonLinesWriter(stream, quiet=quiet)
+    writer.write_header("input_small.txt", event)
+    writer.write_report(report)
+    header, record = [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    assert header == {
+        "input_file": "input_small.txt", "max_time": 10, "max_budget": 200
+    }
+    assert record["solver"] == "bottom_up"
+    assert record["enjoyment"] == 370
+    assert record["time_used"] == 9
+    if quiet:
+        assert "activities" not in record
+    else:
+        assert record["activities"]["name"] == [a.name for a in chosen]
+        assert record["activities"]["time"] == [a.time for a in chosen]
+
+
+@pytest.mark.parametrize("quiet", [False, True])
+def test_csv_writer(event_and_report, quiet):
+    event, report, chosen = event_and_report
+    stream = io.StringIO()
+
+    writer = CsvWriter(stream, quiet=quiet)
+    writer.write_header("input_small.txt", event)
+    writer.write_report(report)
+    rows = list(csv.reader(io.StringIO(stream.getvalue())))
+
+    if quiet:
+        assert rows == [
+            ["solver", "enjoyment", "time_used", "execution_time"],
+            ["bottom_up", "370", "9", "0.25000"],
+        ]
+    else:
+        assert rows[0] == [
+            "solver",
+            "name",
+            "time",
+            "cost",
+            "enjoyment",
+            "total_enjoyment",
+            "time_used",
+            "execution_time",
+        ]
+        assert rows[1:] == [
+            [
+                "bottom_up",
+                a.name,
+                str(a.time),
+                str(a.cost),
+                str(a.enjoyment),
+                "370",
+                "9",
+                "0.25000",
+            ]
+            for a in chosen
+        ]
+
+
+def test_csv_writer_keeps_metrics_of_empty_plans():
+    stream = io.StringIO()
+
+    CsvWriter(stream).write_report(Report("bottom_up", "BOTTOM UP", [], 0, 0, 0.5))
+    rows = list(csv.reader(io.StringIO(stream.getvalue())))
+
+    assert rows == [["bottom_up", "", "", "", "", "0", "0", "0.50000"]]
+
+
+def test_writers_registry():
+    assert set(WRITERS) == {"text", "jsonl", "csv"}
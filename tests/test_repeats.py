@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from student_society_event_planner.algorithms import (
+    _binary_split,
+    bottom_up,
+    bruteforce,
+    constrained_bottom_up,
+    hirschberg,
+    resumable_bottom_up,
+    sparse_dp,
+)
+from student_society_event_planner.classes import Activity, Constraints, Event
+from student_society_event_planner.generator import generate_event
+
+from .helpers import _reference_exhaustive
+
+
+def _duplicated(event):
+    """The same event with each repeat written out as its own activity."""
+    activities = [
+        Activity(a.name, a.time, a.cost, a.enjoyment)
+        for a in event.activities
+        for _ in range(a.repeats)
+    ]
+    return Event(event.max_time, event.max_budget, activities)
+
+
+@pytest.mark.parametrize("repeats", [1, 2, 3, 7, 8, 100])
+def test_binary_split_covers_every_count(repeats):
+    activity = Activity("A", 1, 0, 1, repeats)
+    counts = [count for _, count in _binary_split([activity])]
+
+    assert sum(counts) == repeats
+    assert len(counts) <= repeats.bit_length() + 1
+
+    # Every number of copies from 0 to repeats is some subset of the items
+    reachable = {0}
+    for count in counts:
+        reachable |= {r + count for r in reachable}
+    assert reachable >= set(range(repeats + 1))
+
+
+@pytest.mark.parametrize(
+    "solver", [bruteforce, bottom_up, hirschberg, sparse_dp, resumable_bottom_up]
+)
+def test_repeats_match_duplicated_activities_on_random_events(solver):
+    rng = random.Random(21)
+
+    for trial in range(60):
+        activities = [
+            Activity(
+                f"A{i}",
+                rng.randint(0, 5),
+                0,
+                rng.randint(0, 50),
+                rng.randint(1, 4),
+            )
+            for i in range(rng.randint(1, 4))
+        ]
+        event = Event(rng.randint(0, 20), 0, activities)
+
+        _, ref_enjoyment, ref_time = _reference_exhaustive(_duplicated(event))
+        chosen, enjoyment, time_used = solver(event, time_limit=10.0)
+
+        assert enjoyment == ref_enjoyment, f"Trial {trial}"
+        assert enjoyment == sum(a.enjoyment for a in chosen), f"Trial {trial}"
+        assert time_used == sum(a.time for a in chosen), f"Trial {trial}"
+        for activity in activities:
+            assert sum(a is activity for a in chosen) <= activity.repeats, \
+                f"Trial {trial}: {activity.name} chosen too many times"
+        if solver is not bruteforce:
+            assert time_used == ref_time, f"Trial {trial}"
+
+
+def test_constrained_repeats_match_duplicated_activities():
+    """Unlinked repeatable activities keep their repeats under constraints."""
+    event = Event(
+        max_time=12,
+        max_budget=0,
+        activities=[
+            Activity("Workshop", 2, 0, 30, repeats=5),
+            Activity("Pub-Quiz", 3, 0, 40),
+            Activity("Karaoke", 3, 0, 35),
+        ],
+        constraints=Constraints(conflicts=[("Pub-Quiz", "Karaoke")]),
+    )
+
+    chosen, enjoyment, time_used = constrained_bottom_up(event, time_limit=10.0)
+
+    # Four workshops and the quiz beat five workshops
+    assert enjoyment == 160
+    assert time_used == 11
+    assert sorted(a.name for a in chosen).count("Workshop") == 4
+
+
+def test_many_repeats_cost_logarithmically_many_items():
+    event = generate_event(50, seed=2, max_repeats=1000, max_time=500)
+
+    items = _binary_split(event.activities)
+    assert len(items) <= 50 * 11
+
+    _, enjoyment, _ = bottom_up(event, time_limit=10.0)
+    _, sparse_enjoyment, _ = sparse_dp(event, time_limit=10.0)
+    assert enjoyment == sparse_enjoyment
@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from student_society_event_planner.algorithms import bottom_up
+from student_society_event_planner.classes import Activity, Constraints, Event
+from student_society_event_planner.sensitivity import sensitivity
+from student_society_event_planner.utils import load_event_file
+
+
+def _with_changed(event, index, time=None, enjoyment=None):
+    """Return a copy of the event with one copy of an activity's values changed."""
+    activities = list(event.activities)
+    old = activities[index]
+    changed = Activity(
+        old.name,
+        old.time if time is None else time,
+        old.cost,
+        old.enjoyment if enjoyment is None else enjoyment,
+    )
+
+    # The other copies of a repeated activity keep their values
+    if old.repeats > 1:
+        activities[index] = Activity(
+            old.name, old.time, old.cost, old.enjoyment, old.repeats - 1
+        )
+        activities.append(changed)
+    else:
+        activities[index] = changed
+    return Event(event.max_time, event.max_budget, activities), changed
+
+
+def _is_chosen(event, activity):
+    return any(a is activity for a in bottom_up(event, time_limit=10.0)[0])
+
+
+def _check_thresholds(event):
+    results = sensitivity(event, time_limit=10.0)
+    chosen = bottom_up(event, time_limit=10.0)[0]
+
+    assert [r.activity for r in results] == event.activities
+    for index, result in enumerate(results):
+        activity = result.activity
+        assert result.included == any(a is activity for a in chosen)
+
+        if result.enjoyment_threshold is None:
+            assert activity.time > event.max_time
+        else:
+            # More enjoyment than the threshold puts it in every optimal plan
+            changed, copy = _with_changed(
+                event, index, enjoyment=max(0, result.enjoyment_threshold + 1)
+            )
+            assert _is_chosen(changed, copy), f"{activity.name} should be chosen"
+
+            if result.enjoyment_threshold > 0:
+                changed, copy = _with_changed(
+                    event, index, enjoyment=result.enjoyment_threshold - 1
+                )
+                assert not _is_chosen(changed, copy), \
+                    f"{activity.name} should not be chosen"
+
+        # Any longer than the time threshold and it is in no optimal plan
+        if result.time_threshold < event.max_time:
+            changed, copy = _with_changed(event, index, time=result.time_threshold + 1)
+            assert not _is_chosen(changed, copy), \
+                f"{activity.name} should not be chosen"
+
+
+def test_sensitivity_on_small_input():
+    event = load_event_file("input_small.txt")
+    results = {r.activity.name: r for r in sensitivity(event, time_limit=10.0)}
+
+    assert results["Museum-Trip"].included
+    _check_thresholds(event)
+
+
+@pytest.mark.parametrize("fname", ["input_medium.txt", "input_large.txt"])
+def test_sensitivity_thresholds_flip_the_plan_on_provided_inputs(fname):
+    _check_thresholds(load_event_file(fname))
+
+
+def test_sensitivity_thresholds_flip_the_plan_on_random_events():
+    rng = random.Random(6)
+
+    for _ in range(40):
+        activities = [
+            Activity(f"A{i}", rng.randint(0, 7), 0, rng.randint(0, 100))
+            for i in range(rng.randint(1, 8))
+        ]
+        _check_thresholds(Event(rng.randint(0, 15), 0, activities))
+
+
+def test_sensitivity_thresholds_flip_the_plan_with_repeats():
+    rng = random.Random(39)
+
+    for _ in range(40):
+        activities = [
+            Activity(f"A{i}", rng.randint(0, 7), 0, rng.randint(0, 100),
+                     rng.randint(1, 4))
+            for i in range(rng.randint(1, 6))
+        ]
+        _check_thresholds(Event(rng.randint(0, 20), 0, activities))
+
+
+def test_sensitivity_of_a_repeated_activity_is_for_one_copy():
+    """The thresholds are for one workshop, with the other two still available."""
+    event = Event(
+        max_time=6,
+        max_budget=0,
+        activities=[
+            Activity("Workshop", 2, 0, 30, repeats=3),
+            Activity("Quiz", 1, 0, 4),
+        ],
+    )
+    results = {r.activity.name: r for r in sensitivity(event, time_limit=10.0)}
+
+    # Without the copy the best is two workshops and the quiz, 64, and with it
+    # the other four hours hold two workshops, 60, so it is worth more than 4
+    assert results["Workshop"].included
+    assert results["Workshop"].enjoyment_threshold == 4
+    assert results["Workshop"].time_threshold == 3
+    _check_thresholds(event)
+
+
+def test_sensitivity_rejects_constraints():
+    activities = [Activity("A", 1, 0, 1)]
+
+    with pytest.raises(ValueError):
+        sensitivity(
+            Event(5, 0, activities, constraints=Constraints(excluded={"A"})),
+            time_limit=10.0,
+        )
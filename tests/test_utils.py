@@ -51,8 +51,11 @@ def test_load_event_file_missing_file_raises_file_not_found():
         # negative constraints are rejected
         ("1\n-1 10\nA 1 1 1\n", ValueError),
         ("1\n10 -1\nA 1 1 1\n", ValueError),
-        # activity line must have 4 fields
+        # activity line must have 4 fields, or 5 with a repeat count
         ("1\n10 200\nA 1 2\n", ValueError),
+        ("1\n10 200\nA 1 2 3 4 5\n", ValueError),
+        # repeat counts must be positive
+        ("1\n10 200\nA 1 2 3 0\n", ValueError),
     ],
 )
 def test_load_event_file_validation_errors(tmp_path, monkeypatch, content, expected_exc):
@@ -99,3 +102,15 @@ def test_load_event_file_ignores_extra_trailing_lines(tmp_path, monkeypatch):
     event = load_event_file("temp.txt")
     assert len(event.activities) == 1
     assert event.activities[0].name == "A"
+
+
+def test_load_event_file_reads_optional_repeat_count(tmp_path, monkeypatch):
+    """A fifth field on an activity line is its repeat count."""
+    (tmp_path / "input_files").mkdir()
+    (tmp_path / "input_files" / "temp.txt").write_text(
+        "2\n10 200\nWorkshop 1 1 1 3\nTrip 2 2 2\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    event = load_event_file("temp.txt")
+    assert [a.repeats for a in event.activities] == [3, 1]